@@ -77,9 +77,9 @@ Examples:
         print("Collecting system information...")
         logger.log_info("Starting system information collection")
         
-        collection_start_time = time.time()
+        collection_start_time = time.perf_counter()
         system_info = manager.collect_all_info()
-        collection_duration = time.time() - collection_start_time
+        collection_duration = time.perf_counter() - collection_start_time
         
         # Log collection results
         successful = system_info.get('successful_collections', 0)
@@ -101,12 +101,12 @@ Examples:
         if args.json:
             try:
                 print("Exporting to JSON...")
-                export_start_time = time.time()
+                export_start_time = time.perf_counter()
                 
                 json_filename = args.json if isinstance(args.json, str) else None
                 exported_json = manager.export_to_json(json_filename)
                 
-                export_duration = time.time() - export_start_time
+                export_duration = time.perf_counter() - export_start_time
                 file_size = Path(exported_json).stat().st_size if Path(exported_json).exists() else 0
                 
                 print(f"JSON exported: {exported_json} ({file_size:,} bytes)")
@@ -121,12 +121,12 @@ Examples:
         if args.csv:
             try:
                 print("Exporting to CSV...")
-                export_start_time = time.time()
+                export_start_time = time.perf_counter()
                 
                 csv_filename = args.csv if isinstance(args.csv, str) else None
                 exported_csv = manager.export_to_csv(csv_filename)
                 
-                export_duration = time.time() - export_start_time
+                export_duration = time.perf_counter() - export_start_time
                 file_size = Path(exported_csv).stat().st_size if Path(exported_csv).exists() else 0
                 
                 print(f"CSV exported: {exported_csv} ({file_size:,} bytes)")
@@ -141,12 +141,12 @@ Examples:
         if args.pdf:
             try:
                 print("Exporting to PDF...")
-                export_start_time = time.time()
+                export_start_time = time.perf_counter()
                 
                 pdf_filename = args.pdf if isinstance(args.pdf, str) else None
                 exported_pdf = manager.export_to_pdf(pdf_filename)
                 
-                export_duration = time.time() - export_start_time
+                export_duration = time.perf_counter() - export_start_time
                 file_size = Path(exported_pdf).stat().st_size if Path(exported_pdf).exists() else 0
                 
                 print(f"PDF exported: {exported_pdf} ({file_size:,} bytes)")
@@ -159,7 +159,7 @@ Examples:
                 print(f"Error exporting PDF: {e}")
 
         # Summary
-        total_duration = time.time() - collection_start_time
+        total_duration = time.perf_counter() - collection_start_time
         print(f"\nTotal operation time: {total_duration:.2f} seconds")
         
         if export_files:
@@ -173,7 +173,7 @@ Examples:
         # Show log location
         if enable_file:
             from log_config import log_config
-            print(f"\nLogs saved to: {log_config.log_dir.absolute()}")
+            print(f"\nLogs saved to: {log_config.log_dir_abs}")
         
         print("System information collection completed successfully!")
         
@@ -1,13 +1,35 @@
 """Base collector class for system information gathering."""
 
 import logging
+import threading
 import time
 import pythoncom
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from typing import Dict, Any
 from log_config import SystemInfoLogger
 
 
+def run_in_daemon_thread(fn, *args, name: str = None) -> Future:
+    """Call ``fn(*args)`` in a daemon thread and return a Future for its result.
+    
+    Unlike ThreadPoolExecutor workers, daemon threads do not hold up interpreter
+    exit, so closing the GUI mid-collection does not wait for slow WMI queries.
+    """
+    future = Future()
+    
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return future
+
+
 class BaseCollector(ABC):
     """Abstract base class for all system information collectors."""
     
@@ -31,7 +53,7 @@ class BaseCollector(ABC):
             pass  # Already initialized
         
         # Start performance tracking
-        self.collection_start_time = time.time()
+        self.collection_start_time = time.perf_counter()
         self.logger.log_collection_start(collector_name)
         
         try:
@@ -39,7 +61,7 @@ class BaseCollector(ABC):
             result = self.collect()
             
             # Calculate performance metrics
-            duration = time.time() - self.collection_start_time
+            duration = time.perf_counter() - self.collection_start_time
             self.logger.log_performance(f"{collector_name} collection", duration)
             
             # Log success with item count if available
@@ -58,7 +80,7 @@ class BaseCollector(ABC):
             
         except Exception as e:
             # Calculate duration even for failed collections
-            duration = time.time() - self.collection_start_time if self.collection_start_time else 0
+            duration = time.perf_counter() - self.collection_start_time if self.collection_start_time else 0
             
             # Log the error with full traceback
             self.logger.log_collection_error(collector_name, e)
@@ -528,8 +528,8 @@ class NetworkCollector(BaseCollector):
                         sock.sendto(frame, (ip, 30311))
                     except Exception:
                         continue
-            end_time = time.time() + timeout
-            while time.time() < end_time:
+            end_time = time.perf_counter() + timeout
+            while time.perf_counter() < end_time:
                 try:
                     data, addr = sock.recvfrom(4096)
                 except socket.timeout:
@@ -1367,7 +1367,8 @@ class SoftwareCollector(BaseCollector):
         except Exception:
             pass
 
-        # Sort by name then version, limit to reasonable count
+        # Sort by name then version, limit to reasonable count; the WMI fallback
+        # can leave either as None, so compare missing values as ""
         filtered.sort(key=lambda x: (x.get("name") or "", x.get("version") or ""))
         return filtered[:200]
     
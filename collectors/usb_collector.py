@@ -2,93 +2,330 @@
 
 import wmi
 import re
-from typing import Dict, Any, List
-from .base_collector import BaseCollector
+import sys
+import pythoncom
+from typing import Dict, Any, Iterator, List, Tuple
+from .base_collector import BaseCollector, run_in_daemon_thread
+
+
+# USB device ID format: USB\VID_xxxx&PID_xxxx\serial or USB\VID_xxxx&PID_xxxx&MI_xx\serial
+_VID_RE = re.compile(r'VID_([0-9A-Fa-f]{4})')
+_PID_RE = re.compile(r'PID_([0-9A-Fa-f]{4})')
+
+# Device class keywords in priority order; group N of _CLASS_RE maps to _CLASS_LABELS[N].
+# The lookahead makes finditer report overlapping matches so priority, not position, wins.
+_CLASS_RE = re.compile(
+    r'(?=(hub)|(storage|disk)|(keyboard)|(mouse)|(audio|speaker)|(camera|webcam)|(network|ethernet))'
+)
+_CLASS_LABELS = (
+    "Unknown", "Hub", "Mass Storage", "HID (Keyboard)", "HID (Mouse)",
+    "Audio", "Video", "Communications",
+)
+
+_UNKNOWN = "Unknown"
+_USB_PREFIX = "USB\\"
+
+# Sentinel stored in vendor_id/product_id when the device ID carries no VID/PID
+UNKNOWN_ID = 0xFFFF
+
+# Column order of the ``usb_devices`` table; each column is a plain list
+DEVICE_COLUMNS = (
+    "device_name", "device_id", "pnp_device_id", "status", "manufacturer",
+    "vendor_id", "product_id", "serial_number", "usb_class",
+)
+
+
+def _parse_device_id(device_id: str) -> Tuple[int, int, str]:
+    """Split a USB device ID into (vendor_id, product_id, serial_number).
+
+    Vendor and product IDs are returned as 16-bit integers, or ``UNKNOWN_ID``
+    when missing.
+    """
+    vid_match = _VID_RE.search(device_id)
+    pid_match = _PID_RE.search(device_id)
+    vendor_id = int(vid_match.group(1), 16) if vid_match else UNKNOWN_ID
+    product_id = int(pid_match.group(1), 16) if pid_match else UNKNOWN_ID
+
+    # Serial number is the third path component, minus any interface info
+    parts = device_id.split('\\')
+    if len(parts) > 2:
+        serial_number = parts[2].split('&', 1)[0]
+    else:
+        serial_number = "Not available"
+    return vendor_id, product_id, serial_number
+
+
+def _classify(device_name: str) -> str:
+    """Guess the USB class from the lower-cased device name."""
+    best = len(_CLASS_LABELS)
+    for match in _CLASS_RE.finditer(device_name):
+        if match.lastindex < best:
+            best = match.lastindex
+            if best == 1:
+                break
+    return _CLASS_LABELS[best] if best < len(_CLASS_LABELS) else _UNKNOWN
+
+
+def format_id(value: int) -> str:
+    """Format a vendor/product ID as the 4-digit hex string used in device IDs."""
+    return _UNKNOWN if value == UNKNOWN_ID else f"{value:04X}"
+
+
+def with_hex_ids(usb_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of a USB collection result with vendor/product IDs as hex strings.
+    
+    Used wherever the result is shown or exported, so users see "046D" rather
+    than 1133 and "Unknown" rather than ``UNKNOWN_ID``.
+    """
+    devices = usb_info.get("usb_devices") if isinstance(usb_info, dict) else None
+    if not isinstance(devices, dict) or "vendor_id" not in devices:
+        return usb_info
+    devices = dict(devices)
+    devices["vendor_id"] = [format_id(value) for value in devices["vendor_id"]]
+    devices["product_id"] = [format_id(value) for value in devices["product_id"]]
+    result = dict(usb_info)
+    result["usb_devices"] = devices
+    return result
+
+
+def _empty_columns() -> Dict[str, Any]:
+    """Create an empty column-oriented USB device table."""
+    columns: Dict[str, Any] = {"columns": list(DEVICE_COLUMNS)}
+    for name in DEVICE_COLUMNS:
+        columns[name] = []
+    return columns
+
+
+def to_records(columns: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert the column-oriented ``usb_devices`` table into one dict per device."""
+    names = columns.get("columns", [])
+    return [dict(zip(names, row)) for row in zip(*(columns[name] for name in names))]
 
 
 class USBCollector(BaseCollector):
     """Collects information about USB devices."""
     
+    @staticmethod
+    def _run_wmi_query(query):
+        """Run a WMI query on a worker thread with its own COM initialization.
+        
+        WMI objects are bound to the thread that created them, so ``query``
+        must return plain Python values rather than WMI objects.
+        """
+        pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+        try:
+            return query(wmi.WMI())
+        finally:
+            pythoncom.CoUninitialize()
+    
+    @staticmethod
+    def _query_devices(c) -> List[Tuple[str, str, str, str, str]]:
+        """Return (name, device_id, pnp_device_id, status, manufacturer) for USB devices.
+        
+        Missing values are replaced by "Unknown". Each property is fetched from
+        the COM object only once.
+        """
+        g = getattr
+        unknown = _UNKNOWN
+        usb_prefix = _USB_PREFIX
+        rows = []
+        append = rows.append
+        for device in c.Win32_PnPEntity():
+            device_id = g(device, 'DeviceID', None)
+            if device_id and device_id.startswith(usb_prefix):
+                append((g(device, 'Name', None) or unknown,
+                        device_id,
+                        g(device, 'PNPDeviceID', None) or unknown,
+                        g(device, 'Status', None) or unknown,
+                        g(device, 'Manufacturer', None) or unknown))
+        return rows
+    
+    @staticmethod
+    def _query_devices_setupapi() -> List[Tuple[str, str, str, str, str]]:
+        """Enumerate present USB devices directly through SetupAPI/CfgMgr32.
+        
+        Returns the same rows as ``_query_devices`` without going through the
+        out-of-process WMI service. Raises ``OSError`` if enumeration fails.
+        """
+        import ctypes
+        from ctypes import wintypes
+        
+        DIGCF_PRESENT = 0x00000002
+        DIGCF_ALLCLASSES = 0x00000004
+        SPDRP_DEVICEDESC = 0x00000000
+        SPDRP_MFG = 0x0000000B
+        SPDRP_FRIENDLYNAME = 0x0000000C
+        ERROR_NO_MORE_ITEMS = 259
+        CR_SUCCESS = 0
+        INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+        
+        class SP_DEVINFO_DATA(ctypes.Structure):
+            _fields_ = [
+                ("cbSize", wintypes.DWORD),
+                ("ClassGuid", ctypes.c_byte * 16),
+                ("DevInst", wintypes.DWORD),
+                ("Reserved", ctypes.c_void_p),
+            ]
+        
+        setupapi = ctypes.WinDLL('setupapi', use_last_error=True)
+        cfgmgr32 = ctypes.WinDLL('cfgmgr32')
+        
+        SetupDiGetClassDevsW = setupapi.SetupDiGetClassDevsW
+        SetupDiGetClassDevsW.argtypes = [ctypes.c_void_p, wintypes.LPCWSTR, wintypes.HWND, wintypes.DWORD]
+        SetupDiGetClassDevsW.restype = ctypes.c_void_p
+        SetupDiEnumDeviceInfo = setupapi.SetupDiEnumDeviceInfo
+        SetupDiEnumDeviceInfo.argtypes = [ctypes.c_void_p, wintypes.DWORD, ctypes.POINTER(SP_DEVINFO_DATA)]
+        SetupDiEnumDeviceInfo.restype = wintypes.BOOL
+        SetupDiGetDeviceInstanceIdW = setupapi.SetupDiGetDeviceInstanceIdW
+        SetupDiGetDeviceInstanceIdW.argtypes = [ctypes.c_void_p, ctypes.POINTER(SP_DEVINFO_DATA),
+                                                wintypes.LPWSTR, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD)]
+        SetupDiGetDeviceInstanceIdW.restype = wintypes.BOOL
+        SetupDiGetDeviceRegistryPropertyW = setupapi.SetupDiGetDeviceRegistryPropertyW
+        SetupDiGetDeviceRegistryPropertyW.argtypes = [ctypes.c_void_p, ctypes.POINTER(SP_DEVINFO_DATA),
+                                                      wintypes.DWORD, ctypes.POINTER(wintypes.DWORD),
+                                                      ctypes.c_void_p, wintypes.DWORD,
+                                                      ctypes.POINTER(wintypes.DWORD)]
+        SetupDiGetDeviceRegistryPropertyW.restype = wintypes.BOOL
+        SetupDiDestroyDeviceInfoList = setupapi.SetupDiDestroyDeviceInfoList
+        SetupDiDestroyDeviceInfoList.argtypes = [ctypes.c_void_p]
+        SetupDiDestroyDeviceInfoList.restype = wintypes.BOOL
+        CM_Get_DevNode_Status = cfgmgr32.CM_Get_DevNode_Status
+        CM_Get_DevNode_Status.argtypes = [ctypes.POINTER(wintypes.ULONG), ctypes.POINTER(wintypes.ULONG),
+                                          wintypes.DWORD, wintypes.ULONG]
+        CM_Get_DevNode_Status.restype = wintypes.DWORD
+        
+        buffer = ctypes.create_unicode_buffer(1024)
+        
+        def get_property(hdev, devinfo, prop):
+            if SetupDiGetDeviceRegistryPropertyW(hdev, ctypes.byref(devinfo), prop, None, buffer,
+                                                 ctypes.sizeof(buffer), None):
+                return buffer.value or None
+            return None
+        
+        # The "USB" enumerator yields every device whose instance ID starts with USB\,
+        # the same set the Win32_PnPEntity filter selects
+        hdev = SetupDiGetClassDevsW(None, "USB", None, DIGCF_PRESENT | DIGCF_ALLCLASSES)
+        if hdev in (None, INVALID_HANDLE_VALUE):
+            raise ctypes.WinError(ctypes.get_last_error())
+        
+        unknown = _UNKNOWN
+        rows = []
+        try:
+            devinfo = SP_DEVINFO_DATA()
+            devinfo.cbSize = ctypes.sizeof(SP_DEVINFO_DATA)
+            index = 0
+            while SetupDiEnumDeviceInfo(hdev, index, ctypes.byref(devinfo)):
+                index += 1
+                if not SetupDiGetDeviceInstanceIdW(hdev, ctypes.byref(devinfo), buffer,
+                                                   len(buffer), None):
+                    continue
+                device_id = buffer.value
+                if not device_id.startswith(_USB_PREFIX):
+                    continue
+                
+                # Win32_PnPEntity.Name is the friendly name when set, otherwise the description
+                name = (get_property(hdev, devinfo, SPDRP_FRIENDLYNAME)
+                        or get_property(hdev, devinfo, SPDRP_DEVICEDESC) or unknown)
+                manufacturer = get_property(hdev, devinfo, SPDRP_MFG) or unknown
+                
+                status_flags = wintypes.ULONG()
+                problem = wintypes.ULONG()
+                if CM_Get_DevNode_Status(ctypes.byref(status_flags), ctypes.byref(problem),
+                                         devinfo.DevInst, 0) == CR_SUCCESS:
+                    status = "Error" if problem.value else "OK"
+                else:
+                    status = unknown
+                
+                rows.append((name, device_id, device_id, status, manufacturer))
+            
+            error = ctypes.get_last_error()
+            if error != ERROR_NO_MORE_ITEMS:
+                raise ctypes.WinError(error)
+        finally:
+            SetupDiDestroyDeviceInfoList(hdev)
+        return rows
+    
+    @staticmethod
+    def _query_controllers(c) -> List[Dict[str, Any]]:
+        """Return USB host controller records."""
+        usb_controllers = []
+        for controller in c.Win32_USBController():
+            controller_info = {
+                "name": controller.Name or _UNKNOWN,
+                "device_id": controller.DeviceID or _UNKNOWN,
+                "manufacturer": controller.Manufacturer or _UNKNOWN,
+                "status": controller.Status or _UNKNOWN
+            }
+            usb_controllers.append(controller_info)
+        return usb_controllers
+    
+    def _controllers_result(self, controllers_future) -> List[Dict[str, Any]]:
+        """Wait for the controller query; a failure there leaves the devices intact."""
+        try:
+            return controllers_future.result()
+        except Exception as e:
+            self.log_error(f"Error collecting USB controllers: {str(e)}", exc_info=True)
+            return []
+    
+    def _enumerate_devices(self) -> List[Tuple[str, str, str, str, str]]:
+        """Return raw USB device rows, preferring SetupAPI and falling back to WMI."""
+        if sys.platform.startswith("win"):
+            try:
+                return self._query_devices_setupapi()
+            except Exception as e:
+                self.log_warning(f"SetupAPI USB enumeration failed, falling back to WMI: {e}")
+        return run_in_daemon_thread(self._run_wmi_query, self._query_devices, name="usb-wmi").result()
+    
+    def iter_devices(self) -> Iterator[Dict[str, Any]]:
+        """Yield one dict per USB device, in the same shape as ``to_records``.
+        
+        Use this instead of ``collect`` when devices are written out one at a
+        time and the column table is not needed.
+        """
+        for name, device_id, pnp_device_id, status, manufacturer in self._enumerate_devices():
+            vendor_id, product_id, serial_number = _parse_device_id(device_id)
+            yield {
+                "device_name": name,
+                "device_id": device_id,
+                "pnp_device_id": pnp_device_id,
+                "status": status,
+                "manufacturer": manufacturer,
+                "vendor_id": vendor_id,
+                "product_id": product_id,
+                "serial_number": serial_number,
+                "usb_class": _classify(name.lower())
+            }
+    
     def collect(self) -> Dict[str, Any]:
         """Collect USB device information."""
         try:
-            c = wmi.WMI()
-            usb_devices = []
+            # The device and controller queries are independent; the controller query
+            # runs on its own thread while the devices are enumerated
+            controllers_future = run_in_daemon_thread(self._run_wmi_query, self._query_controllers,
+                                                      name="usb-wmi")
+            devices = self._enumerate_devices()
             
-            # Get USB devices
-            for device in c.Win32_PnPEntity():
-                if device.DeviceID and device.DeviceID.startswith('USB\\'):
-                    device_info = {
-                        "device_name": device.Name or "Unknown",
-                        "device_id": device.DeviceID or "Unknown",
-                        "pnp_device_id": device.PNPDeviceID or "Unknown",
-                        "status": device.Status or "Unknown",
-                        "manufacturer": device.Manufacturer or "Unknown"
-                    }
-                    
-                    # Parse USB device ID to extract vendor and product IDs
-                    if device.DeviceID:
-                        # USB device ID format: USB\VID_xxxx&PID_xxxx\serial or USB\VID_xxxx&PID_xxxx&MI_xx\serial
-                        vid_match = re.search(r'VID_([0-9A-Fa-f]{4})', device.DeviceID)
-                        pid_match = re.search(r'PID_([0-9A-Fa-f]{4})', device.DeviceID)
-                        
-                        if vid_match:
-                            device_info["vendor_id"] = vid_match.group(1)
-                        else:
-                            device_info["vendor_id"] = "Unknown"
-                            
-                        if pid_match:
-                            device_info["product_id"] = pid_match.group(1)
-                        else:
-                            device_info["product_id"] = "Unknown"
-                        
-                        # Try to extract serial number from the device ID
-                        parts = device.DeviceID.split('\\')
-                        if len(parts) > 2:
-                            serial_part = parts[2]
-                            # Remove interface info if present
-                            if '&' in serial_part:
-                                serial_part = serial_part.split('&')[0]
-                            device_info["serial_number"] = serial_part
-                        else:
-                            device_info["serial_number"] = "Not available"
-                    
-                    # Determine USB class/type based on device info
-                    device_name = device.Name.lower() if device.Name else ""
-                    if "hub" in device_name:
-                        device_info["usb_class"] = "Hub"
-                    elif "storage" in device_name or "disk" in device_name:
-                        device_info["usb_class"] = "Mass Storage"
-                    elif "keyboard" in device_name:
-                        device_info["usb_class"] = "HID (Keyboard)"
-                    elif "mouse" in device_name:
-                        device_info["usb_class"] = "HID (Mouse)"
-                    elif "audio" in device_name or "speaker" in device_name:
-                        device_info["usb_class"] = "Audio"
-                    elif "camera" in device_name or "webcam" in device_name:
-                        device_info["usb_class"] = "Video"
-                    elif "network" in device_name or "ethernet" in device_name:
-                        device_info["usb_class"] = "Communications"
-                    else:
-                        device_info["usb_class"] = "Unknown"
-                    
-                    usb_devices.append(device_info)
+            usb_devices = _empty_columns()
             
-            # Also check for USB controllers
-            usb_controllers = []
-            for controller in c.Win32_USBController():
-                controller_info = {
-                    "name": controller.Name or "Unknown",
-                    "device_id": controller.DeviceID or "Unknown",
-                    "manufacturer": controller.Manufacturer or "Unknown",
-                    "status": controller.Status or "Unknown"
-                }
-                usb_controllers.append(controller_info)
+            # Transpose the device rows into the table columns with C-level zip/extend
+            # rather than looking up nine list.append methods per device
+            for column, values in zip(DEVICE_COLUMNS[:5], zip(*devices)):
+                usb_devices[column].extend(values)
+            
+            # Parse USB device ID to extract vendor/product IDs and serial
+            parsed_ids = [_parse_device_id(device_id) for device_id in usb_devices["device_id"]]
+            for column, values in zip(("vendor_id", "product_id", "serial_number"), zip(*parsed_ids)):
+                usb_devices[column].extend(values)
+            
+            # Determine USB class/type based on device info
+            usb_devices["usb_class"].extend([_classify(name.lower()) for name in usb_devices["device_name"]])
+            
+            usb_controllers = self._controllers_result(controllers_future)
             
             return {
                 "usb_devices": usb_devices,
                 "usb_controllers": usb_controllers,
-                "total_devices": len(usb_devices),
+                "total_devices": len(usb_devices["device_name"]),
                 "total_controllers": len(usb_controllers),
                 "status": "success"
             }
@@ -96,10 +333,14 @@ class USBCollector(BaseCollector):
         except Exception as e:
             self.log_error(f"Error collecting USB information: {str(e)}", exc_info=True)
             return {
-                "usb_devices": [],
+                "usb_devices": _empty_columns(),
                 "usb_controllers": [],
                 "total_devices": 0,
                 "total_controllers": 0,
                 "error": str(e),
                 "status": "failed"
-            } 
\ No newline at end of file
+            }
+    
+    def _get_item_count(self, result: Dict[str, Any]) -> int:
+        """Override to return USB device count."""
+        return result.get('total_devices', 0)
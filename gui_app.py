@@ -2,12 +2,34 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
+import logging
+import os
+import queue
+import shutil
+import subprocess
+import sys
 import threading
-import json
 import time
 from datetime import datetime
+from typing import Optional, Tuple
 from log_config import setup_application_logging, SystemInfoLogger, log_config
-from system_info_manager import SystemInfoManager
+from system_info_manager import SystemInfoManager, dumps_json, EXPORT_BUFFER_SIZE
+from collectors.usb_collector import with_hex_ids
+
+
+# Log files shown in the Logs tab, keyed like self.log_widgets
+LOG_FILES = {
+    'main': "system_info_app.log",
+    'error': "system_info_errors.log",
+    'collection': "collections.log"
+}
+LOG_MAX_LINES = 500  # Lines kept in each log widget
+LOG_TAIL_BYTES = 128 * 1024  # Bytes read from the end of a log when (re)opening it
+LOG_QUEUE_SIZE = 10000  # Records buffered for the Logs tab while it is hidden
+LOG_DRAIN_BATCH = 2000  # Records moved from the queue to the widgets per tick
+LOG_DRAIN_INTERVAL_MS = 250
+TEXT_INSERT_CHUNK = 64 * 1024  # Characters inserted into a Text widget per step
+PROGRESS_INTERVAL_MS = 200  # Progress bar animation step while busy
 
 
 class SystemInfoGUI:
@@ -27,14 +49,34 @@ class SystemInfoGUI:
         self.manager = SystemInfoManager(enable_logging=False)  # Don't reinitialize logging
         self.system_info = {}
         
+        # Category payloads waiting to be rendered; a tab is only serialized
+        # into its text widget the first time it is shown
+        self._tab_data = {}
+        self._tab_rendered = set()
+        self._insert_jobs = {}
+        
+        # Summary and dongle info for the current collection, computed once
+        self._cached_summary = None
+        self._cached_dongle = None
+        self._json_cache = {}
+        
         # Create GUI components
         self.create_widgets()
         
         # Status
         self.is_collecting = False
         
-        # Log update timer
+        # Set when the window closes; background jobs then drop their results
+        self._closing = False
+        
+        # Live log view: records arrive through log_queue, files are only read
+        # for the initial tail and after a manual refresh
         self.log_update_timer = None
+        self._log_state = {}
+        self._log_last = {}
+        self._pending_log_text = {log_key: '' for log_key in LOG_FILES}
+        self.log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._log_handlers = []
         self.start_log_updates()
     
     def create_widgets(self):
@@ -114,6 +156,7 @@ class SystemInfoGUI:
         
         # Create tabs
         self.create_tabs()
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # Status bar
         self.status_var = tk.StringVar(value="Ready - Logging initialized")
@@ -124,6 +167,7 @@ class SystemInfoGUI:
     def create_tabs(self):
         """Create tabs for different information categories."""
         self.tabs = {}
+        self._tab_keys = []
         
         tab_names = [
             ("Overview", "overview"),
@@ -141,16 +185,30 @@ class SystemInfoGUI:
         for tab_name, tab_key in tab_names:
             frame = ttk.Frame(self.notebook)
             self.notebook.add(frame, text=tab_name)
+            self._tab_keys.append(tab_key)
             
             if tab_key == "logs":
                 # Special handling for logs tab
                 self.create_logs_tab(frame)
+                self._logs_tab_index = self.notebook.index(frame)
             else:
-                # Create scrolled text widget for other tabs
-                text_widget = scrolledtext.ScrolledText(frame, wrap=tk.WORD, state='disabled')
+                # Create scrolled text widget for other tabs; JSON tabs scroll
+                # horizontally instead of word-wrapping
+                if tab_key == "overview":
+                    text_widget = scrolledtext.ScrolledText(frame, wrap=tk.WORD, state='disabled')
+                else:
+                    text_widget = self.create_unwrapped_text(frame, state='disabled')
                 text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
                 self.tabs[tab_key] = text_widget
     
+    def create_unwrapped_text(self, parent, **kwargs):
+        """Create a non-wrapping ScrolledText with an extra horizontal scrollbar."""
+        text_widget = scrolledtext.ScrolledText(parent, wrap=tk.NONE, **kwargs)
+        hbar = ttk.Scrollbar(text_widget.frame, orient=tk.HORIZONTAL, command=text_widget.xview)
+        hbar.pack(side=tk.BOTTOM, fill=tk.X, before=text_widget)
+        text_widget.configure(xscrollcommand=hbar.set)
+        return text_widget
+    
     def create_logs_tab(self, frame):
         """Create the logs tab with log viewer and controls."""
         # Create notebook for different log types
@@ -161,24 +219,21 @@ class SystemInfoGUI:
         main_log_frame = ttk.Frame(log_notebook)
         log_notebook.add(main_log_frame, text="Application Log")
         
-        self.main_log_text = scrolledtext.ScrolledText(main_log_frame, wrap=tk.WORD, 
-                                                      font=("Consolas", 9))
+        self.main_log_text = self.create_unwrapped_text(main_log_frame, font=("Consolas", 9))
         self.main_log_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Error log
         error_log_frame = ttk.Frame(log_notebook)
         log_notebook.add(error_log_frame, text="Error Log")
         
-        self.error_log_text = scrolledtext.ScrolledText(error_log_frame, wrap=tk.WORD, 
-                                                       font=("Consolas", 9))
+        self.error_log_text = self.create_unwrapped_text(error_log_frame, font=("Consolas", 9))
         self.error_log_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Collection log
         collection_log_frame = ttk.Frame(log_notebook)
         log_notebook.add(collection_log_frame, text="Collection Log")
         
-        self.collection_log_text = scrolledtext.ScrolledText(collection_log_frame, wrap=tk.WORD, 
-                                                           font=("Consolas", 9))
+        self.collection_log_text = self.create_unwrapped_text(collection_log_frame, font=("Consolas", 9))
         self.collection_log_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Log control frame
@@ -203,48 +258,171 @@ class SystemInfoGUI:
             'error': self.error_log_text,
             'collection': self.collection_log_text
         }
+        
+        # Track the visible log so Save Log copies the right file
+        self.log_notebook = log_notebook
+        self._log_tab_keys = ['main', 'error', 'collection']
+        self._current_log_key = 'main'
+        log_notebook.bind('<<NotebookTabChanged>>', self._on_log_tab_changed)
+    
+    def _on_log_tab_changed(self, event=None):
+        """Remember which log sub-tab is selected."""
+        try:
+            self._current_log_key = self._log_tab_keys[self.log_notebook.index(self.log_notebook.select())]
+        except (tk.TclError, IndexError):
+            self._current_log_key = 'main'
+        # Records for a hidden log were held back; show them now
+        self.flush_pending_log_text(self._current_log_key)
+    
+    def flush_pending_log_text(self, log_key):
+        """Append text buffered while a log sub-tab was hidden."""
+        pending = self._pending_log_text.get(log_key)
+        if pending:
+            self._pending_log_text[log_key] = ''
+            self.update_log_widget(self.log_widgets[log_key], pending)
     
     def start_log_updates(self):
-        """Start automatic log updates."""
-        self.update_logs()
-        
-    def update_logs(self):
-        """Update log displays."""
-        if self.auto_refresh_var.get():
+        """Show the current log tails and start streaming new records."""
+        self.reload_log_views()
+        self._log_handlers = log_config.attach_queue_handlers(self.log_queue)
+        self.drain_log_queue()
+    
+    def stop_log_updates(self):
+        """Stop streaming records into the log views."""
+        if self.log_update_timer:
+            self.root.after_cancel(self.log_update_timer)
+            self.log_update_timer = None
+        root_logger = logging.getLogger()
+        for handler in self._log_handlers:
+            root_logger.removeHandler(handler)
+        self._log_handlers = []
+    
+    def reload_log_views(self):
+        """Rebuild every log widget from the tail of its log file."""
+        # Write out records still queued or buffered for the file handlers, so
+        # the records dropped from the GUI queue below are in the files too
+        log_config.flush()
+        while True:
             try:
-                # Update main application log
-                main_log_content = self.read_log_file("system_info_app.log")
-                self.update_log_widget(self.main_log_text, main_log_content)
-                
-                # Update error log
-                error_log_content = self.read_log_file("system_info_errors.log")
-                self.update_log_widget(self.error_log_text, error_log_content)
-                
-                # Update collection log
-                collection_log_content = self.read_log_file("collections.log")
-                self.update_log_widget(self.collection_log_text, collection_log_content)
+                self.log_queue.get_nowait()
+            except queue.Empty:
+                break
+        for log_key in self._pending_log_text:
+            self._pending_log_text[log_key] = ''
+        
+        for log_key, log_filename in LOG_FILES.items():
+            # Skip widgets whose file has not changed since they were last rebuilt
+            signature = self._log_signature(log_filename)
+            if signature is not None and self._log_last.get(log_key) == signature:
+                continue
+            self._log_last[log_key] = signature
+            self._log_state.pop(log_filename, None)
+            new_text, reset = self.read_log_file(log_filename)
+            if new_text is not None:
+                self.update_log_widget(self.log_widgets[log_key], new_text, reset)
+    
+    def buffer_log_text(self, log_key, text):
+        """Hold text for a hidden log widget, keeping at most LOG_TAIL_BYTES characters."""
+        buffered = self._pending_log_text[log_key] + text
+        if len(buffered) > LOG_TAIL_BYTES:
+            buffered = buffered[-LOG_TAIL_BYTES:]
+            # Do not start on a partial line
+            buffered = buffered[buffered.find('\n') + 1:]
+        self._pending_log_text[log_key] = buffered
+    
+    def _log_signature(self, log_filename: str) -> Optional[Tuple[int, int, int]]:
+        """Return ``(inode, mtime_ns, size)`` for a log file, or None if it cannot be read."""
+        try:
+            st = (log_config.log_dir / log_filename).stat()
+        except OSError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+    
+    def drain_log_queue(self):
+        """Move queued log records into the log widgets while the Logs tab is shown."""
+        try:
+            logs_visible = self.notebook.index(self.notebook.select()) == self._logs_tab_index
+            if self.auto_refresh_var.get() and logs_visible:
+                if any(handler.dropped for handler in self._log_handlers):
+                    # The queue overflowed while hidden; the files have the full story
+                    for handler in self._log_handlers:
+                        handler.dropped = False
+                    self.reload_log_views()
+                else:
+                    pending = {}
+                    for _ in range(LOG_DRAIN_BATCH):
+                        try:
+                            target, message = self.log_queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        pending.setdefault(target, []).append(message)
+                    
+                    for target, messages in pending.items():
+                        text = "\n".join(messages) + "\n"
+                        if target == self._current_log_key:
+                            self.update_log_widget(self.log_widgets[target], text)
+                        else:
+                            # Hidden sub-tab: buffer until it is selected
+                            self.buffer_log_text(target, text)
                 
-            except Exception as e:
-                pass  # Silently handle log reading errors
+        except Exception as e:
+            pass  # Silently handle log display errors
         
-        # Schedule next update
-        self.log_update_timer = self.root.after(2000, self.update_logs)  # Update every 2 seconds
+        # Cheap when idle: the next tick only polls an empty queue
+        self.log_update_timer = self.root.after(LOG_DRAIN_INTERVAL_MS, self.drain_log_queue)
     
-    def read_log_file(self, log_filename: str, max_lines: int = 500) -> str:
-        """Read content from a specific log file."""
+    def read_log_file(self, log_filename: str) -> Tuple[Optional[str], bool]:
+        """Read the complete lines appended to a log file since the last call.
+        
+        Returns ``(new_text, reset)``. ``new_text`` is None when nothing changed.
+        ``reset`` is True when the file was rotated, truncated or is missing and
+        the widget must be cleared before inserting ``new_text``.
+        """
+        state = self._log_state.setdefault(log_filename, {'offset': 0, 'inode': None, 'missing': False})
         try:
             log_file_path = log_config.log_dir / log_filename
-            if log_file_path.exists():
-                with open(log_file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    # Return last max_lines
-                    return ''.join(lines[-max_lines:])
-            return f"Log file {log_filename} not found."
+            try:
+                st = log_file_path.stat()
+            except FileNotFoundError:
+                if state['missing']:
+                    return None, False
+                state.update(offset=0, inode=None, missing=True)
+                return f"Log file {log_filename} not found.", True
+            
+            reset = state['missing'] or st.st_ino != state['inode'] or st.st_size < state['offset']
+            if reset:
+                # New, rotated or truncated file: start again from its tail
+                state.update(offset=max(0, st.st_size - LOG_TAIL_BYTES), inode=st.st_ino, missing=False)
+            elif st.st_size == state['offset']:
+                return None, False
+            
+            with open(log_file_path, 'rb') as f:
+                f.seek(state['offset'])
+                data = f.read()
+            
+            # Only consume complete lines so multi-byte characters are never split
+            last_newline = data.rfind(b'\n')
+            if last_newline < 0:
+                return ("" if reset else None), reset
+            data = data[:last_newline + 1]
+            state['offset'] += len(data)
+            if reset:
+                # Drop the partial line at the start of the tail window and keep
+                # only the lines the widget will show
+                lines = data.splitlines(keepends=True)
+                if state['offset'] > len(data):
+                    lines = lines[1:]
+                data = b''.join(lines[-LOG_MAX_LINES:])
+            return data.decode('utf-8', errors='replace'), reset
         except Exception as e:
-            return f"Error reading {log_filename}: {e}"
+            state.update(offset=0, inode=None)
+            return f"Error reading {log_filename}: {e}\n", True
     
-    def update_log_widget(self, widget, content: str):
-        """Update a log text widget with new content."""
+    def update_log_widget(self, widget, new_text: str, reset: bool = False,
+                          max_lines: int = LOG_MAX_LINES):
+        """Append new text to a log widget, keeping at most ``max_lines`` lines."""
+        if not new_text and not reset:
+            return
         try:
             # Store current scroll position
             current_pos = widget.yview()
@@ -252,8 +430,10 @@ class SystemInfoGUI:
             
             # Update content
             widget.config(state='normal')
-            widget.delete(1.0, tk.END)
-            widget.insert(1.0, content)
+            if reset:
+                widget.delete(1.0, tk.END)
+            self._insert_chunked(widget, new_text, defer=False)
+            widget.delete(1.0, f"end - {max_lines} lines")
             widget.config(state='disabled')
             
             # Auto-scroll to bottom if user was already at bottom
@@ -265,17 +445,19 @@ class SystemInfoGUI:
     
     def refresh_log_view(self):
         """Manually refresh log views."""
-        self.update_logs()
+        self.reload_log_views()
         self.logger.log_info("Log views refreshed manually")
     
     def open_log_directory(self):
         """Open the log directory in file explorer."""
         try:
-            import subprocess
-            import os
-            log_dir = str(log_config.log_dir.absolute())
-            if os.name == 'nt':  # Windows
-                subprocess.Popen(['explorer', log_dir])
+            log_dir = log_config.log_dir_abs
+            if os.name == 'nt':  # Windows: ShellExecute, no child process
+                os.startfile(log_dir)
+            elif sys.platform == 'darwin':
+                subprocess.Popen(['open', log_dir])
+            else:
+                subprocess.Popen(['xdg-open', log_dir])
             self.logger.log_info(f"Opened log directory: {log_dir}")
         except Exception as e:
             self.logger.logger.error(f"Failed to open log directory: {e}")
@@ -308,8 +490,8 @@ class SystemInfoGUI:
     def save_log(self):
         """Save current log content to a file."""
         try:
-            # Get current tab
-            current_tab = self.log_widgets.get('main')  # Default to main log
+            log_key = self._current_log_key
+            source = log_config.log_dir / LOG_FILES[log_key]
             
             filename = filedialog.asksaveasfilename(
                 defaultextension=".log",
@@ -317,10 +499,16 @@ class SystemInfoGUI:
                 title="Save Log File"
             )
             
-            if filename and current_tab:
-                content = current_tab.get(1.0, tk.END)
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(content)
+            if filename:
+                if source.exists():
+                    # The widget only shows a tail; copy the whole file on disk,
+                    # after writing out records still queued or buffered
+                    log_config.flush()
+                    shutil.copyfile(source, filename)
+                else:
+                    content = self.log_widgets[log_key].get(1.0, tk.END)
+                    with open(filename, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+                        f.write(content)
                 
                 self.logger.log_info(f"Log saved to: {filename}")
                 messagebox.showinfo("Success", f"Log saved to: {filename}")
@@ -343,33 +531,34 @@ class SystemInfoGUI:
         self.export_csv_btn.config(state='disabled')
         
         self.progress_var.set("Collecting system information...")
-        self.progress_bar.start()
+        self.progress_bar.start(PROGRESS_INTERVAL_MS)
         
         # Clear previous data
+        self._cached_summary = None
+        self._cached_dongle = None
+        self._json_cache = {}
         self.clear_all_tabs()
         
-        # Start collection in separate thread
-        thread = threading.Thread(target=self.collect_info_thread)
-        thread.daemon = True
-        thread.start()
+        # Start collection in a daemon thread so closing the window never waits for it
+        self._start_worker(self.collect_info_thread)
     
     def collect_info_thread(self):
         """Thread function for collecting system information."""
         try:
-            collection_start_time = time.time()
+            collection_start_time = time.perf_counter()
             self.logger.log_info("Collection thread started")
             
             self.system_info = self.manager.collect_all_info()
             
-            collection_duration = time.time() - collection_start_time
+            collection_duration = time.perf_counter() - collection_start_time
             self.logger.log_performance("GUI collection thread", collection_duration)
             
             # Update GUI in main thread
-            self.root.after(0, self.collection_completed)
+            self._post_to_ui(self.collection_completed)
             
         except Exception as e:
             self.logger.logger.error(f"Error during collection thread: {str(e)}", exc_info=True)
-            self.root.after(0, lambda: self.collection_error(str(e)))
+            self._post_to_ui(self.collection_error, str(e))
     
     def collection_completed(self):
         """Handle completion of system information collection."""
@@ -384,11 +573,14 @@ class SystemInfoGUI:
         self.export_pdf_btn.config(state='normal')
         self.collect_btn.config(state='normal')
         
-        # Update all tabs with collected information
-        self.update_all_tabs()
+        # Traverse the collected data once for both the overview and summary
+        self._cached_summary = self.manager.get_summary()
+        self._cached_dongle = self.manager.get_dongle_info()
         
-        # Update summary
-        self.update_summary()
+        # Render tabs and summary from idle callbacks so Tk can repaint the
+        # re-enabled controls before the heavier widget updates run
+        self.root.after_idle(self.update_all_tabs)
+        self.root.after_idle(self.update_summary, self._cached_summary)
         
         # Log completion stats
         if self.system_info:
@@ -413,7 +605,10 @@ class SystemInfoGUI:
     
     def clear_all_tabs(self):
         """Clear content from all tabs."""
+        self._tab_data = {}
+        self._tab_rendered.clear()
         for text_widget in self.tabs.values():
+            self._insert_jobs.pop(str(text_widget), None)
             text_widget.config(state='normal')
             text_widget.delete(1.0, tk.END)
             text_widget.config(state='disabled')
@@ -424,21 +619,50 @@ class SystemInfoGUI:
             return
         
         # Overview tab
-        self.update_overview_tab()
+        self.update_overview_tab(self._cached_summary)
         
-        # Individual category tabs
+        # Individual category tabs are rendered on first view
         categories = ['pci', 'usb', 'memory', 'storage', 'operating_system', 'software', 'system']
         
-        for category in categories:
-            if category in self.system_info and category in self.tabs:
-                self.update_tab_content(category, self.system_info[category])
-        
-        # Update dongles tab separately
+        self._tab_data = {cat: self.system_info[cat] for cat in categories
+                          if cat in self.system_info and cat in self.tabs}
         if 'dongles' in self.tabs:
-            dongle_data = self.manager.get_dongle_info()
-            self.update_tab_content('dongles', dongle_data)
+            self._tab_data['dongles'] = self._get_dongle_info()
+        self._tab_rendered.clear()
+        
+        self._render_selected_tab()
+    
+    def _selected_tab_key(self):
+        """Return the key of the currently visible notebook tab."""
+        try:
+            return self._tab_keys[self.notebook.index(self.notebook.select())]
+        except (tk.TclError, IndexError):
+            return None
+    
+    def _render_selected_tab(self):
+        """Render the visible tab if its data has not been shown yet."""
+        tab_key = self._selected_tab_key()
+        if tab_key in self._tab_data and tab_key not in self._tab_rendered:
+            self.update_tab_content(tab_key, self._tab_data[tab_key])
+            self._tab_rendered.add(tab_key)
+    
+    def _on_tab_changed(self, event=None):
+        """Render a category tab the first time it is selected."""
+        self._render_selected_tab()
     
-    def update_overview_tab(self):
+    def _get_summary(self):
+        """Return the summary for the current collection, computing it once."""
+        if self._cached_summary is None:
+            self._cached_summary = self.manager.get_summary()
+        return self._cached_summary
+    
+    def _get_dongle_info(self):
+        """Return dongle info for the current collection, computing it once."""
+        if self._cached_dongle is None:
+            self._cached_dongle = self.manager.get_dongle_info()
+        return self._cached_dongle
+    
+    def update_overview_tab(self, summary=None):
         """Update the overview tab with summary information."""
         if 'overview' not in self.tabs:
             return
@@ -448,49 +672,50 @@ class SystemInfoGUI:
         text_widget.delete(1.0, tk.END)
         
         # Get summary
-        summary = self.manager.get_summary()
+        if summary is None:
+            summary = self._get_summary()
         
-        overview_text = f"""System Information Overview
+        parts = [f"""System Information Overview
 Collection Time: {summary.get('collection_timestamp', 'Unknown')}
 Collection Status: {summary.get('collection_status', 'Unknown')}
 
 === SUMMARY ===
-"""
+"""]
         
         if 'summary' in summary:
             for key, value in summary['summary'].items():
-                overview_text += f"{key.replace('_', ' ').title()}: {value}\n"
+                parts.append(f"{key.replace('_', ' ').title()}: {value}\n")
         
         # Add SPIN software status prominently
         if 'software' in self.system_info and 'spin_info' in self.system_info['software']:
             spin_info = self.system_info['software']['spin_info']
-            overview_text += f"\n=== SPIN SOFTWARE STATUS ===\n"
-            overview_text += f"Installed: {spin_info.get('installed', 'Unknown')}\n"
-            overview_text += f"Version: {spin_info.get('version', 'Not found')}\n"
-            overview_text += f"License: {spin_info.get('license_number', 'Not found')}\n"
-            overview_text += f"Install Path: {spin_info.get('install_path', 'Not found')}\n"
+            parts.append(f"\n=== SPIN SOFTWARE STATUS ===\n")
+            parts.append(f"Installed: {spin_info.get('installed', 'Unknown')}\n")
+            parts.append(f"Version: {spin_info.get('version', 'Not found')}\n")
+            parts.append(f"License: {spin_info.get('license_number', 'Not found')}\n")
+            parts.append(f"Install Path: {spin_info.get('install_path', 'Not found')}\n")
         
         # Add CodeMeter dongle status
-        dongle_data = self.manager.get_dongle_info()
-        overview_text += f"\n=== CODEMETER DONGLES ===\n"
+        dongle_data = self._get_dongle_info()
+        parts.append(f"\n=== CODEMETER DONGLES ===\n")
         if 'error' in dongle_data:
-            overview_text += f"Status: {dongle_data['error']}\n"
+            parts.append(f"Status: {dongle_data['error']}\n")
         else:
             total_dongles = dongle_data.get('total_dongles', 0)
-            overview_text += f"Total Dongles Found: {total_dongles}\n"
-            overview_text += f"CodeMeter Service: {'Running' if dongle_data.get('codemeter_service_running') else 'Not Running'}\n"
-            overview_text += f"CodeMeter Installed: {'Yes' if dongle_data.get('codemeter_installed') else 'No'}\n"
+            parts.append(f"Total Dongles Found: {total_dongles}\n")
+            parts.append(f"CodeMeter Service: {'Running' if dongle_data.get('codemeter_service_running') else 'Not Running'}\n")
+            parts.append(f"CodeMeter Installed: {'Yes' if dongle_data.get('codemeter_installed') else 'No'}\n")
             
             if total_dongles > 0:
-                overview_text += f"\nDongle Details:\n"
+                parts.append(f"\nDongle Details:\n")
                 for i, dongle in enumerate(dongle_data.get('dongles', []), 1):
-                    overview_text += f"  {i}. {dongle.get('device_name', 'Unknown')} - Serial: {dongle.get('serial_number', 'Unknown')}\n"
+                    parts.append(f"  {i}. {dongle.get('device_name', 'Unknown')} - Serial: {dongle.get('serial_number', 'Unknown')}\n")
                     if dongle.get('version'):
-                        overview_text += f"     Version: {dongle.get('version')}\n"
+                        parts.append(f"     Version: {dongle.get('version')}\n")
                     if dongle.get('status'):
-                        overview_text += f"     Status: {dongle.get('status')}\n"
+                        parts.append(f"     Status: {dongle.get('status')}\n")
         
-        text_widget.insert(tk.END, overview_text)
+        text_widget.insert(tk.END, ''.join(parts))
         text_widget.config(state='disabled')
     
     def update_tab_content(self, category, data):
@@ -499,42 +724,148 @@ Collection Status: {summary.get('collection_status', 'Unknown')}
             return
         
         text_widget = self.tabs[category]
+        self._insert_jobs.pop(str(text_widget), None)
         text_widget.config(state='normal')
         text_widget.delete(1.0, tk.END)
         
-        # For software tab, exclude dongle data to avoid duplication and show filtered list
-        if category == 'software' and isinstance(data, dict):
-            filtered_data = data.copy()
-            filtered_data.pop('codemeter_dongles', None)
-            filtered_data.pop('_separate_dongles', None)
-            # Prefer showing installed_programs_filtered for clarity
-            if 'installed_programs_filtered' in filtered_data:
-                filtered_data['installed_programs'] = filtered_data['installed_programs_filtered']
-                filtered_data.pop('installed_programs_filtered', None)
-            formatted_data = json.dumps(filtered_data, indent=2, ensure_ascii=False)
-        else:
-            # Format and display the data
-            formatted_data = json.dumps(data, indent=2, ensure_ascii=False)
+        # Serialized text is cached per collection, so re-rendering a tab is free
+        cache_key = (category, id(data))
+        formatted_data = self._json_cache.get(cache_key)
+        if formatted_data is None:
+            # For software tab, exclude dongle data to avoid duplication and show filtered list
+            if category == 'software' and isinstance(data, dict):
+                filtered_data = data.copy()
+                filtered_data.pop('codemeter_dongles', None)
+                filtered_data.pop('_separate_dongles', None)
+                # Prefer showing installed_programs_filtered for clarity
+                if 'installed_programs_filtered' in filtered_data:
+                    filtered_data['installed_programs'] = filtered_data['installed_programs_filtered']
+                    filtered_data.pop('installed_programs_filtered', None)
+                formatted_data = dumps_json(filtered_data)
+            elif category == 'usb':
+                # Vendor/product IDs are stored as integers; show them in hex
+                formatted_data = dumps_json(with_hex_ids(data))
+            else:
+                # Format and display the data
+                formatted_data = dumps_json(data)
+            self._json_cache[cache_key] = formatted_data
         
-        text_widget.insert(tk.END, formatted_data)
         text_widget.config(state='disabled')
+        self._insert_chunked(text_widget, formatted_data)
     
-    def update_summary(self):
+    def _insert_chunked(self, widget, text, chunk=TEXT_INSERT_CHUNK, defer=True):
+        """Append text to a Text widget in ``chunk``-sized pieces.
+        
+        With ``defer`` the first piece is inserted immediately and the rest are
+        queued with ``after_idle`` so Tk can repaint and handle input between
+        them; clearing the widget's entry in ``_insert_jobs`` cancels the rest.
+        Without it the pieces are inserted in place, flushing idle tasks every
+        few pieces. The widget's state is restored after each deferred piece.
+        """
+        if not defer:
+            for i in range(0, len(text), chunk):
+                widget.insert(tk.END, text[i:i + chunk])
+                if i and i % (chunk * 4) == 0:
+                    widget.update_idletasks()
+            return
+        
+        key = str(widget)
+        job = object()
+        self._insert_jobs[key] = job
+        
+        def insert_from(start):
+            if self._insert_jobs.get(key) is not job:
+                return
+            state = widget.cget('state')
+            widget.config(state='normal')
+            widget.insert(tk.END, text[start:start + chunk])
+            widget.config(state=state)
+            if start + chunk < len(text):
+                self.root.after_idle(insert_from, start + chunk)
+            else:
+                del self._insert_jobs[key]
+        
+        insert_from(0)
+    
+    def update_summary(self, summary=None):
         """Update the summary text widget."""
         self.summary_text.config(state='normal')
         self.summary_text.delete(1.0, tk.END)
         
-        summary = self.manager.get_summary()
+        if summary is None:
+            summary = self._get_summary()
         
-        summary_text = "=== SYSTEM SUMMARY ===\n\n"
+        parts = ["=== SYSTEM SUMMARY ===\n\n"]
         
         if 'summary' in summary:
             for key, value in summary['summary'].items():
-                summary_text += f"{key.replace('_', ' ').title()}:\n  {value}\n\n"
+                parts.append(f"{key.replace('_', ' ').title()}:\n  {value}\n\n")
         
-        self.summary_text.insert(tk.END, summary_text)
+        self.summary_text.insert(tk.END, ''.join(parts))
         self.summary_text.config(state='disabled')
     
+    def start_export(self, kind, export_func, filename):
+        """Run an export in a worker thread so the window stays responsive."""
+        self.collect_btn.config(state='disabled')
+        for button in (self.export_json_btn, self.export_csv_btn, self.export_pdf_btn):
+            button.config(state='disabled')
+        self.progress_var.set(f"Exporting {kind}...")
+        self.progress_bar.start(PROGRESS_INTERVAL_MS)
+        
+        self._start_worker(self.export_thread, kind, export_func, filename)
+    
+    @staticmethod
+    def _start_worker(target, *args):
+        """Run ``target`` in a daemon thread, which never delays interpreter exit."""
+        threading.Thread(target=target, args=args, daemon=True).start()
+    
+    def _post_to_ui(self, callback, *args):
+        """Schedule ``callback`` on the Tk thread unless the window is gone."""
+        if self._closing:
+            return
+        try:
+            self.root.after(0, callback, *args)
+        except (tk.TclError, RuntimeError):
+            pass  # Root destroyed between the check and the call
+    
+    def shutdown_workers(self):
+        """Make running background jobs drop their results instead of touching the window."""
+        self._closing = True
+    
+    def export_thread(self, kind, export_func, filename):
+        """Thread function for exporting system information."""
+        try:
+            export_start_time = time.perf_counter()
+            actual_filename = export_func(filename)
+            export_duration = time.perf_counter() - export_start_time
+            
+            self.logger.log_performance(f"GUI {kind} export", export_duration)
+            self._post_to_ui(self.export_completed, actual_filename)
+            
+        except Exception as e:
+            self.logger.logger.error(f"{kind} export failed: {str(e)}", exc_info=True)
+            error_msg = str(e)
+            self._post_to_ui(self.export_failed, kind, error_msg)
+    
+    def export_finished(self):
+        """Restore the controls disabled while an export was running."""
+        self.progress_bar.stop()
+        self.collect_btn.config(state='normal')
+        for button in (self.export_json_btn, self.export_csv_btn, self.export_pdf_btn):
+            button.config(state='normal')
+    
+    def export_completed(self, actual_filename):
+        """Handle completion of an export."""
+        self.export_finished()
+        self.progress_var.set("Export completed successfully")
+        messagebox.showinfo("Success", f"System information exported to:\n{actual_filename}")
+    
+    def export_failed(self, kind, error_msg):
+        """Handle an error during an export."""
+        self.export_finished()
+        self.progress_var.set("Export failed")
+        messagebox.showerror("Error", f"Failed to export {kind} file:\n{error_msg}")
+    
     def export_json(self):
         """Export system information to JSON file."""
         if not self.system_info:
@@ -551,17 +882,7 @@ Collection Status: {summary.get('collection_status', 'Unknown')}
         )
         
         if filename:
-            try:
-                export_start_time = time.time()
-                actual_filename = self.manager.export_to_json(filename)
-                export_duration = time.time() - export_start_time
-                
-                self.logger.log_performance(f"GUI JSON export", export_duration)
-                messagebox.showinfo("Success", f"System information exported to:\n{actual_filename}")
-                
-            except Exception as e:
-                self.logger.logger.error(f"JSON export failed: {str(e)}", exc_info=True)
-                messagebox.showerror("Error", f"Failed to export JSON file:\n{str(e)}")
+            self.start_export('JSON', self.manager.export_to_json, filename)
     
     def export_csv(self):
         """Export system information to CSV file."""
@@ -579,17 +900,7 @@ Collection Status: {summary.get('collection_status', 'Unknown')}
         )
         
         if filename:
-            try:
-                export_start_time = time.time()
-                actual_filename = self.manager.export_to_csv(filename)
-                export_duration = time.time() - export_start_time
-                
-                self.logger.log_performance(f"GUI CSV export", export_duration)
-                messagebox.showinfo("Success", f"System information exported to:\n{actual_filename}")
-                
-            except Exception as e:
-                self.logger.logger.error(f"CSV export failed: {str(e)}", exc_info=True)
-                messagebox.showerror("Error", f"Failed to export CSV file:\n{str(e)}")
+            self.start_export('CSV', self.manager.export_to_csv, filename)
 
     def export_pdf(self):
         """Export system information to PDF file."""
@@ -607,17 +918,7 @@ Collection Status: {summary.get('collection_status', 'Unknown')}
         )
         
         if filename:
-            try:
-                export_start_time = time.time()
-                actual_filename = self.manager.export_to_pdf(filename)
-                export_duration = time.time() - export_start_time
-                
-                self.logger.log_performance(f"GUI PDF export", export_duration)
-                messagebox.showinfo("Success", f"System information exported to:\n{actual_filename}")
-                
-            except Exception as e:
-                self.logger.logger.error(f"PDF export failed: {str(e)}", exc_info=True)
-                messagebox.showerror("Error", f"Failed to export PDF file:\n{str(e)}")
+            self.start_export('PDF', self.manager.export_to_pdf, filename)
 
 
 def main():
@@ -628,8 +929,8 @@ def main():
         
         # Handle application shutdown
         def on_closing():
-            if app.log_update_timer:
-                root.after_cancel(app.log_update_timer)
+            app.stop_log_updates()
+            app.shutdown_workers()
             app.logger.log_info("GUI Application shutting down")
             root.destroy()
         
@@ -1,16 +1,108 @@
 """Logging configuration for System Information Collector."""
 
+import atexit
+import collections
+import copy
 import logging
 import logging.handlers
 import os
+import queue
+import re
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
+
+try:
+    import ahocorasick
+except Exception:  # pragma: no cover
+    ahocorasick = None  # type: ignore
+
+
+DETAILED_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(funcName)s() - %(message)s'
+DETAILED_DATEFMT = '%Y-%m-%d %H:%M:%S'
+
+LOG_BUFFER_SIZE = 64 * 1024  # Write buffer of the log files
+LOG_FLUSH_EVERY = 100  # Records buffered before a forced flush
+LOG_FLUSH_INTERVAL = 1.0  # Seconds between background flushes
+LOG_RING_SIZE = 256  # Recent main-log records kept in memory for tail()
+
+# Extra bytes per '\n' when text-mode files write os.linesep (1 on Windows)
+_NEWLINE_EXTRA = len(os.linesep) - 1
+
+# Level names accepted by setup_logging, resolved once
+_LEVELS = {
+    'NOTSET': logging.NOTSET, 'DEBUG': logging.DEBUG, 'INFO': logging.INFO,
+    'WARNING': logging.WARNING, 'WARN': logging.WARNING, 'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL, 'FATAL': logging.FATAL,
+}
+
+# Messages containing any of these go to the collection log
+COLLECTION_KEYWORDS = (
+    'collection', 'collecting', 'collect', 'export', 'save',
+    'pci', 'usb', 'memory', 'storage', 'system', 'software'
+)
+
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in COLLECTION_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _KEYWORD_AUTOMATON.make_automaton()
+    
+    def _has_collection_keyword(message: str) -> bool:
+        return next(_KEYWORD_AUTOMATON.iter(message), None) is not None
+else:
+    _KEYWORD_RE = re.compile('|'.join(map(re.escape, COLLECTION_KEYWORDS)))
+    
+    def _has_collection_keyword(message: str) -> bool:
+        return _KEYWORD_RE.search(message) is not None
+
+
+def _is_log_name(name: str) -> bool:
+    """Match file names like the ``*.log*`` glob: current and rotated logs."""
+    return '.log' in name and not name.startswith('.')
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs strftime once per second instead of once per record.
+    
+    The formatted text is also remembered on the record, so handlers sharing
+    this formatter (main, error and collection logs) format each record once.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time = (None, '')  # (second, formatted), swapped atomically
+    
+    def format(self, record):
+        cached = record.__dict__.get('_formatted')
+        if cached is not None and cached[0] is self:
+            return cached[1]
+        text = super().format(record)
+        record._formatted = (self, text)
+        return text
+    
+    def formatTime(self, record, datefmt=None):
+        if datefmt is None:
+            # Default format appends milliseconds, which change within a second
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, formatted = self._cached_time
+        if second != cached_second:
+            formatted = time.strftime(datefmt, self.converter(second))
+            self._cached_time = (second, formatted)
+        return formatted
 
 
 class LogConfig:
     """Centralized logging configuration for the application."""
     
+    # Shared by every handler; formatters keep no per-handler state
+    detailed_formatter = CachedTimeFormatter(DETAILED_FORMAT, datefmt=DETAILED_DATEFMT)
+    simple_formatter = CachedTimeFormatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S')
+    
     def __init__(self, log_dir: str = "logs", max_log_size: int = 10485760, backup_count: int = 5):
         """
         Initialize logging configuration.
@@ -23,7 +115,13 @@ class LogConfig:
         self.log_dir = Path(log_dir)
         self.max_log_size = max_log_size
         self.backup_count = backup_count
+        self._listener = None
+        self._file_handlers = []
+        self._ring_handler = None
+        self._flush_stop = None
+        self._listener_lock = threading.Lock()
         self.setup_log_directory()
+        atexit.register(self.shutdown)
         
     def setup_log_directory(self):
         """Create log directory if it doesn't exist."""
@@ -32,6 +130,8 @@ class LogConfig:
         except Exception as e:
             print(f"Warning: Could not create log directory {self.log_dir}: {e}")
             self.log_dir = Path(".")  # Fallback to current directory
+        # Resolved once; absolute() calls os.getcwd() every time
+        self.log_dir_abs = str(self.log_dir.absolute())
     
     def setup_logging(self, console_level: str = "INFO", file_level: str = "DEBUG", 
                      enable_console: bool = True, enable_file: bool = True):
@@ -45,6 +145,7 @@ class LogConfig:
             enable_file: Whether to enable file logging
         """
         # Clear any existing handlers
+        self.shutdown()
         root_logger = logging.getLogger()
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
@@ -52,23 +153,15 @@ class LogConfig:
         # Set root logger level to DEBUG to catch everything
         root_logger.setLevel(logging.DEBUG)
         
-        # Create formatters
-        detailed_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(funcName)s() - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        simple_formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%H:%M:%S'
-        )
+        detailed_formatter = self.detailed_formatter
+        simple_formatter = self.simple_formatter
         
         handlers = []
         
         # Console handler
         if enable_console:
             console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(getattr(logging, console_level.upper()))
+            console_handler.setLevel(_LEVELS[console_level.upper()])
             console_handler.setFormatter(simple_formatter)
             handlers.append(console_handler)
         
@@ -76,11 +169,11 @@ class LogConfig:
         if enable_file:
             # Main application log
             main_log_file = self.log_dir / "system_info_app.log"
-            main_handler = logging.handlers.RotatingFileHandler(
+            main_handler = BufferedRotatingFileHandler(
                 main_log_file, maxBytes=self.max_log_size, backupCount=self.backup_count,
                 encoding='utf-8'
             )
-            main_handler.setLevel(getattr(logging, file_level.upper()))
+            main_handler.setLevel(_LEVELS[file_level.upper()])
             main_handler.setFormatter(detailed_formatter)
             handlers.append(main_handler)
             
@@ -96,7 +189,7 @@ class LogConfig:
             
             # Collection-specific log (daily rotation)
             collection_log_file = self.log_dir / "collections.log"
-            collection_handler = logging.handlers.TimedRotatingFileHandler(
+            collection_handler = BufferedTimedRotatingFileHandler(
                 collection_log_file, when='midnight', interval=1, backupCount=30,
                 encoding='utf-8'
             )
@@ -106,53 +199,202 @@ class LogConfig:
             collection_handler.addFilter(CollectionLogFilter())
             handlers.append(collection_handler)
         
-        # Add all handlers to root logger
+        # The console handler stays on the root logger so output keeps its order
+        # with print(); file handlers run on a listener thread behind a queue so
+        # callers never wait on disk I/O
+        file_handlers = [h for h in handlers if isinstance(h, logging.FileHandler)]
         for handler in handlers:
-            root_logger.addHandler(handler)
+            if handler not in file_handlers:
+                root_logger.addHandler(handler)
+        if file_handlers:
+            log_queue = queue.SimpleQueue()
+            root_logger.addHandler(RecordQueueHandler(log_queue))
+            self._file_handlers = file_handlers
+            # Mirror of the main log in memory, so tail() needs no disk I/O
+            self._ring_handler = RingBufferHandler(LOG_RING_SIZE, _LEVELS[file_level.upper()])
+            self._ring_handler.setFormatter(detailed_formatter)
+            self._listener = logging.handlers.QueueListener(
+                log_queue, *file_handlers, self._ring_handler, respect_handler_level=True
+            )
+            self._listener.start()
+            
+            # Buffered handlers hold quiet periods' records; flush them regularly
+            self._flush_stop = threading.Event()
+            threading.Thread(
+                target=self._flush_loop, args=(self._flush_stop, file_handlers),
+                name="log-flush", daemon=True
+            ).start()
         
         # Log startup message
         logger = logging.getLogger(__name__)
         logger.info("="*80)
         logger.info("System Information Collector - Logging Started")
-        logger.info(f"Log directory: {self.log_dir.absolute()}")
+        logger.info(f"Log directory: {self.log_dir_abs}")
         logger.info(f"Console logging: {'Enabled' if enable_console else 'Disabled'} ({console_level})")
         logger.info(f"File logging: {'Enabled' if enable_file else 'Disabled'} ({file_level})")
         logger.info("="*80)
         
         return handlers
     
+    @staticmethod
+    def _flush_loop(stop_event: threading.Event, handlers: list):
+        """Flush the file handlers every LOG_FLUSH_INTERVAL seconds until stopped."""
+        while not stop_event.wait(LOG_FLUSH_INTERVAL):
+            for handler in handlers:
+                handler.flush()
+    
+    def shutdown(self):
+        """Stop the file listener thread and close the file handlers, flushing pending records."""
+        if self._flush_stop is not None:
+            self._flush_stop.set()
+            self._flush_stop = None
+        with self._listener_lock:
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener = None
+        for handler in self._file_handlers:
+            handler.close()
+        self._file_handlers = []
+        self._ring_handler = None
+    
+    def flush(self):
+        """Write every record logged so far to the log files."""
+        self._drain_queue()
+        for handler in self._file_handlers:
+            handler.flush()
+    
+    def _drain_queue(self):
+        """Wait until the listener has handled every record queued so far."""
+        with self._listener_lock:
+            if self._listener is not None:
+                # stop() handles everything already queued before joining the thread
+                self._listener.stop()
+                self._listener.start()
+    
+    def tail(self, max_lines: int = 10) -> list:
+        """
+        Get the last lines of the main log written by this process, from memory.
+        
+        Only the last LOG_RING_SIZE records are kept; returns an empty list
+        when file logging is not set up.
+        """
+        ring_handler = self._ring_handler
+        if ring_handler is None or max_lines <= 0:
+            return []
+        self._drain_queue()
+        lines = []
+        # Records can span several lines (tracebacks); walk back until enough
+        for text in reversed(ring_handler.records()):
+            lines[:0] = text.splitlines()
+            if len(lines) >= max_lines:
+                break
+        return lines[-max_lines:]
+    
+    def attach_queue_handlers(self, log_queue: queue.Queue, file_level: str = "DEBUG") -> list:
+        """
+        Mirror the three log files into a queue for a live log viewer.
+        
+        Each handler puts ``(target, formatted_message)`` tuples on ``log_queue``,
+        with target ``'main'``, ``'error'`` or ``'collection'`` and the same level
+        and filter as the corresponding file handler.
+        
+        Args:
+            log_queue: Queue receiving the formatted records
+            file_level: Log level of the main application log
+        
+        Returns:
+            The handlers added to the root logger
+        """
+        formatter = self.detailed_formatter
+        
+        main_handler = QueueLogHandler(log_queue, 'main', _LEVELS[file_level.upper()])
+        error_handler = QueueLogHandler(log_queue, 'error', logging.ERROR)
+        collection_handler = QueueLogHandler(log_queue, 'collection', logging.INFO)
+        collection_handler.addFilter(CollectionLogFilter())
+        
+        handlers = [main_handler, error_handler, collection_handler]
+        root_logger = logging.getLogger()
+        for handler in handlers:
+            handler.setFormatter(formatter)
+            root_logger.addHandler(handler)
+        return handlers
+    
     def get_log_files(self) -> list:
         """Get list of all log files in the log directory."""
         try:
-            return list(self.log_dir.glob("*.log*"))
+            with os.scandir(self.log_dir) as entries:
+                return [Path(entry.path) for entry in entries if _is_log_name(entry.name)]
         except Exception:
             return []
     
+    def iter_log_files(self) -> list:
+        """Get ``(name, size_in_bytes)`` for every log file in the log directory."""
+        files = []
+        try:
+            with os.scandir(self.log_dir) as entries:
+                for entry in entries:
+                    if not _is_log_name(entry.name):
+                        continue
+                    try:
+                        # DirEntry caches the stat result, so each file is stat'ed at most once
+                        if entry.is_file():
+                            files.append((entry.name, entry.stat().st_size))
+                    except OSError:
+                        continue  # Rotated away or deleted while listing
+        except OSError:
+            pass
+        return files
+    
     def get_latest_log_content(self, max_lines: int = 1000) -> str:
         """Get the content of the latest main log file."""
         try:
-            main_log_file = self.log_dir / "system_info_app.log"
-            if main_log_file.exists():
-                with open(main_log_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    # Return last max_lines
-                    return ''.join(lines[-max_lines:])
-            return "No log file found."
+            tail = self.get_latest_log_tail(max_lines)
+            if tail is None:
+                return "No log file found."
+            return ''.join(line + '\n' for line in tail)
         except Exception as e:
             return f"Error reading log file: {e}"
     
+    def get_latest_log_tail(self, max_lines: int = 10) -> Optional[list]:
+        """Get the last lines of the main log file, or None if it does not exist."""
+        main_log_file = self.log_dir / "system_info_app.log"
+        if not main_log_file.exists():
+            return None
+        # Recent records may still be queued or sitting in handler buffers
+        self.flush()
+        return self._read_tail(main_log_file, max_lines)
+    
+    @staticmethod
+    def _read_tail(path: Path, max_lines: int, block_size: int = 64 * 1024) -> list:
+        """Return the last ``max_lines`` lines of a file, reading backwards in blocks."""
+        if max_lines <= 0:
+            return []
+        with open(path, 'rb') as f:
+            pos = f.seek(0, 2)
+            data = b''
+            # One newline more than needed so the first kept line is complete
+            while pos > 0 and data.count(b'\n') <= max_lines:
+                step = min(block_size, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+        return data.decode('utf-8', errors='replace').splitlines()[-max_lines:]
+    
     def cleanup_old_logs(self, days_to_keep: int = 30):
         """Clean up log files older than specified days."""
         try:
-            import time
             current_time = time.time()
             cutoff_time = current_time - (days_to_keep * 24 * 60 * 60)
             
             cleaned_count = 0
-            for log_file in self.log_dir.glob("*.log*"):
-                if log_file.stat().st_mtime < cutoff_time:
-                    log_file.unlink()
-                    cleaned_count += 1
+            # DirEntry.stat() reuses data from the directory scan where the OS provides it
+            with os.scandir(self.log_dir) as entries:
+                for entry in entries:
+                    if not _is_log_name(entry.name) or not entry.is_file():
+                        continue
+                    if entry.stat().st_mtime < cutoff_time:
+                        os.unlink(entry.path)
+                        cleaned_count += 1
             
             logger = logging.getLogger(__name__)
             logger.info(f"Cleaned up {cleaned_count} old log files (older than {days_to_keep} days)")
@@ -162,18 +404,151 @@ class LogConfig:
             logger.error(f"Error during log cleanup: {e}")
 
 
+class _BufferedFileMixin:
+    """Write a file handler's records through a large buffer.
+    
+    The per-record flush of StreamHandler is skipped until ``flush_every``
+    records are pending or a record at ``flush_level`` or above arrives; closing,
+    rolling over or an explicit ``flush()`` call still write everything out.
+    """
+    
+    buffer_size = LOG_BUFFER_SIZE
+    flush_every = LOG_FLUSH_EVERY
+    flush_level = logging.WARNING
+    _pending = 0
+    _defer_flush = False
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=getattr(self, 'errors', None))
+    
+    def emit(self, record):
+        self._pending += 1
+        self._defer_flush = record.levelno < self.flush_level and self._pending < self.flush_every
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+    
+    def flush(self):
+        if self._defer_flush:
+            return
+        super().flush()
+        self._pending = 0
+
+
+class BufferedRotatingFileHandler(_BufferedFileMixin, logging.handlers.RotatingFileHandler):
+    """Size-rotating file handler with buffered writes.
+    
+    The file size is tracked in-process: the base class seeks to the end of the
+    file for every record, which would flush the buffer each time.
+    """
+    
+    _size = 0
+    _record_size = 0  # Encoded size of the record being emitted
+    
+    def _open(self):
+        stream = super()._open()
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def shouldRollover(self, record):
+        if self.stream is None:                 # delay was set...
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            # Counted here, where the formatted text is known just before the write
+            text = self.format(record) + self.terminator
+            size = len(text.encode(self.encoding or 'utf-8', getattr(self, 'errors', None) or 'strict'))
+            if _NEWLINE_EXTRA:
+                size += _NEWLINE_EXTRA * text.count('\n')  # Text mode writes os.linesep
+            # Like RotatingFileHandler, never roll over an empty file: a record
+            # larger than maxBytes would otherwise rotate on every emit
+            if self._size and self._size + size >= self.maxBytes:
+                self._record_size = size
+                return True
+            self._size += size
+        return False
+    
+    def doRollover(self):
+        super().doRollover()
+        # The record that triggered the rollover is written to the new file
+        self._size += self._record_size
+        self._record_size = 0
+
+
+class BufferedTimedRotatingFileHandler(_BufferedFileMixin, logging.handlers.TimedRotatingFileHandler):
+    """Time-rotating file handler with buffered writes."""
+
+
 class CollectionLogFilter(logging.Filter):
     """Filter to capture collection-related log messages."""
     
     def filter(self, record):
         """Filter collection-related messages."""
-        collection_keywords = [
-            'collection', 'collecting', 'collect', 'export', 'save',
-            'pci', 'usb', 'memory', 'storage', 'system', 'software'
-        ]
-        
-        message = record.getMessage().lower()
-        return any(keyword in message for keyword in collection_keywords)
+        return _has_collection_keyword(record.getMessage().lower())
+
+
+class QueueLogHandler(logging.Handler):
+    """Handler that pushes formatted records onto a queue for a GUI log viewer."""
+    
+    def __init__(self, log_queue: queue.Queue, target: str, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.log_queue = log_queue
+        self.target = target
+        self.dropped = False  # Set when the queue was full and records were lost
+    
+    def emit(self, record):
+        """Queue the formatted record without ever blocking the caller."""
+        try:
+            self.log_queue.put_nowait((self.target, self.format(record)))
+        except queue.Full:
+            self.dropped = True
+        except Exception:
+            self.handleError(record)
+
+
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps a record's message and traceback apart.
+    
+    The stock ``prepare()`` folds the traceback into ``msg``, so filters on the
+    listener side (CollectionLogFilter) would scan the traceback's file paths too.
+    """
+    
+    _exc_formatter = logging.Formatter()
+    
+    def prepare(self, record):
+        """Resolve the message and traceback to text, dropping unpicklable objects."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class RingBufferHandler(logging.Handler):
+    """Handler that keeps the last ``capacity`` formatted records in memory."""
+    
+    def __init__(self, capacity: int, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.buffer = collections.deque(maxlen=capacity)
+    
+    def emit(self, record):
+        """Remember the formatted record, dropping the oldest one when full."""
+        try:
+            self.buffer.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+    
+    def records(self) -> list:
+        """Get a snapshot of the buffered records, oldest first."""
+        self.acquire()
+        try:
+            return list(self.buffer)
+        finally:
+            self.release()
 
 
 class SystemInfoLogger:
@@ -200,33 +575,49 @@ class SystemInfoLogger:
     
     def log_collection_start(self, collector_name: str):
         """Log the start of a collection operation."""
-        self.logger.info(f"Starting collection: {collector_name}")
+        self.logger.info("Starting collection: %s", collector_name)
     
     def log_collection_success(self, collector_name: str, item_count: int = None):
         """Log successful completion of collection."""
         if item_count is not None:
-            self.logger.info(f"Collection completed successfully: {collector_name} - {item_count} items collected")
+            self.logger.info("Collection completed successfully: %s - %s items collected", collector_name, item_count)
         else:
-            self.logger.info(f"Collection completed successfully: {collector_name}")
+            self.logger.info("Collection completed successfully: %s", collector_name)
     
     def log_collection_error(self, collector_name: str, error: Exception):
         """Log collection errors with full traceback."""
-        self.logger.error(f"Collection failed: {collector_name} - {str(error)}", exc_info=True)
+        # Use the given exception rather than sys.exc_info(), so this also
+        # works outside an except block (no traceback is logged then)
+        self.logger.error("Collection failed: %s - %s", collector_name, error, exc_info=error)
     
     def log_export_operation(self, export_type: str, filename: str, success: bool = True):
         """Log export operations."""
         if success:
-            self.logger.info(f"Export successful: {export_type} -> {filename}")
+            self.logger.info("Export successful: %s -> %s", export_type, filename)
         else:
-            self.logger.error(f"Export failed: {export_type} -> {filename}")
+            self.logger.error("Export failed: %s -> %s", export_type, filename)
+    
+    def log_export_operations(self, operations: list):
+        """Log several ``(export_type, filename, success)`` exports, one record per outcome."""
+        # The entries are formatted eagerly, so only build those that will be logged
+        if self.logger.isEnabledFor(logging.INFO):
+            succeeded = [f"{export_type} -> {filename}" for export_type, filename, success in operations if success]
+            if succeeded:
+                self.logger.info("Export successful: %s", "; ".join(succeeded))
+        if self.logger.isEnabledFor(logging.ERROR):
+            failed = [f"{export_type} -> {filename}" for export_type, filename, success in operations if not success]
+            if failed:
+                self.logger.error("Export failed: %s", "; ".join(failed))
     
     def log_system_info(self, info_type: str, details: dict):
         """Log system information details."""
-        self.logger.debug(f"System info collected - {info_type}: {details}")
+        # details can be large; skip repr() entirely unless DEBUG is enabled
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("System info collected - %s: %s", info_type, details)
     
     def log_performance(self, operation: str, duration: float):
         """Log performance metrics."""
-        self.logger.info(f"Performance - {operation}: {duration:.2f} seconds")
+        self.logger.info("Performance - %s: %.2f seconds", operation, duration)
 
 
 # Global instance for easy access
@@ -1,49 +1,239 @@
 """PDF report exporter for System Information Collector."""
 
 from typing import Dict, Any, List, Optional
-from datetime import datetime
+from concurrent.futures import Executor
+from operator import itemgetter
+import asyncio
+import heapq
 import os
+import re
+import threading
+import time
+from xml.sax.saxutils import escape
 
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import mm
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, LongTable, TableStyle
+
+
+# Page geometry shared by the Platypus and canvas renderers
+_PAGE_LAYOUT = dict(
+    pagesize=A4,
+    leftMargin=18 * mm,
+    rightMargin=18 * mm,
+    topMargin=16 * mm,
+    bottomMargin=16 * mm,
+)
+# Width available to a flowable inside the 6 pt padded frame
+_FRAME_WIDTH = A4[0] - _PAGE_LAYOUT["leftMargin"] - _PAGE_LAYOUT["rightMargin"] - 12
+
+# Tables longer than this are emitted as separate chunks with a repeated header;
+# splitting one huge table across pages re-lays out all remaining rows per page
+LONG_TABLE_CHUNK = 200
+
+# Table cells carry 6 pt of padding on each side
+_CELL_PADDING = 12
+
+# Table header rows, shared by every report
+NETWORK_HEADER = ["Interface", "IP(s)", "Subnet(s)"]
+RAM_HEADER = ["Slot", "Size (GB)", "Speed (MHz)", "Type"]
+STORAGE_HEADER = ["Model", "Type", "Size (GB)", "Serial", "Interface"]
+PCI_HEADER = ["Device Name", "Manufacturer", "Serial"]
+DONGLE_HEADER = ["Name", "Serial", "Version", "Status", "Source"]
+SOFTWARE_HEADER = ["Name", "Version", "Publisher"]
+
+# Placeholder for missing fields; one shared object across all table cells
+_UNKNOWN = "Unknown"
+
+# Fallback software filter: skip updates/hotfixes, deprioritize Microsoft entries
+_PROGRAM_EXCLUDE_RE = re.compile(
+    r"security update|cumulative update|feature update|servicing stack|hotfix|update|kb", re.IGNORECASE
+)
+_MICROSOFT_RE = re.compile(r"microsoft", re.IGNORECASE)
+_FALLBACK_PROGRAM_LIMIT = 40
+
+# Generic/system PCI devices hidden from the report (matched against
+# lowercased "name friendly_name service")
+_PCI_EXCLUDED_TOKENS = (
+    "motherboard resources",
+    "system timer",
+    "numeric data processor",
+    "programmable interrupt controller",
+    "direct memory access controller",
+    "high precision event timer",
+    "pci-to-pci bridge",
+    "pci express root port",
+    "root port",
+    "root complex",
+    "bus enumerator",
+    "composite bus enumerator",
+    "acpi",
+    "standard sata ahci controller",
+    "standard nvm express controller",
+    "standard pci-to-pci bridge",
+    "pci express downstream switch port",
+    "pci express upstream switch port",
+    "downstream switch port",
+    "upstream switch port",
+    "standard isa bridge",
+    "standard host cpu bridge",
+    # AMD generic/controller tokens from user feedback
+    "usb 3.10 extensible host controller",
+    "xhci host controller",
+    "generic usb xhci host controller",
+    "platform security processor",
+    "psp",
+    "smbus",
+    "amd-raid",
+    "raid bottom device",
+    "raid controller",
+    "amd raid",
+    "amd pci",
+)
+_PCI_EXCLUDE_RE = re.compile("|".join(map(re.escape, _PCI_EXCLUDED_TOKENS)))
+
+# Report palette, parsed from hex once at import
+_GRID_COLOR = colors.HexColor("#cccccc")
+_HEADER_BG = colors.HexColor("#e8eef8")
+_KV_HEADER_BG = colors.HexColor("#f5f5f5")
+_HEADER_FG = colors.HexColor("#333333")
+_ROW_PALETTE = (colors.white, colors.HexColor("#f9fbff"))
+
+# Table styles are immutable once built, so every table shares them
+_KV_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), _KV_HEADER_BG),
+    ("TEXTCOLOR", (0, 0), (-1, 0), _HEADER_FG),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+    ("GRID", (0, 0), (-1, -1), 0.25, _GRID_COLOR),
+    ("BACKGROUND", (0, 1), (-1, -1), colors.white),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+])
+_DATA_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), _HEADER_BG),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("ALIGN", (0, 0), (-1, 0), "LEFT"),
+    ("GRID", (0, 0), (-1, -1), 0.25, _GRID_COLOR),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), list(_ROW_PALETTE)),
+])
+# Plain-string body cells rendered like the 9/11 pt "Small" paragraph style
+_SMALL_ROWS_STYLE = TableStyle([
+    ("FONTSIZE", (0, 1), (-1, -1), 9),
+    ("LEADING", (0, 1), (-1, -1), 11),
+])
+
+class _CanvasStory:
+    """Story replacement that lays out and draws each flowable as it is appended.
+
+    Follows the single-frame layout of SimpleDocTemplate (6 pt frame padding,
+    space before dropped at the top of a page and overlapping the previous
+    space after, tables split across pages) without keeping the story in memory.
+    """
+
+    _FUZZ = 1e-6
+    padding = 6
+
+    def __init__(self, filename: str, pagesize, leftMargin: float, rightMargin: float,
+                 topMargin: float, bottomMargin: float):
+        self.canvas = canvas.Canvas(filename, pagesize=pagesize)
+        page_width, page_height = pagesize
+        self._x = leftMargin + self.padding
+        self._width = page_width - leftMargin - rightMargin - 2 * self.padding
+        self._top = page_height - topMargin - self.padding
+        self._bottom = bottomMargin + self.padding
+        self._new_frame()
+
+    def _new_frame(self) -> None:
+        self._y = self._top
+        self._at_top = True
+        self._prev_space_after = 0
+
+    def _space_before(self, flowable) -> float:
+        if self._at_top:
+            return 0
+        return max(flowable.getSpaceBefore() - self._prev_space_after, 0)
+
+    def _try_draw(self, flowable, force: bool = False) -> bool:
+        space = self._space_before(flowable)
+        avail = self._y - self._bottom - space
+        if avail <= 0 and not force:
+            return False
+        w, h = flowable.wrapOn(self.canvas, self._width, avail)
+        if h > avail + self._FUZZ and not force:
+            return False
+        y = self._y - space - h
+        flowable.drawOn(self.canvas, self._x, y, _sW=self._width - w)
+        self._prev_space_after = flowable.getSpaceAfter()
+        self._y = y - self._prev_space_after
+        self._at_top = False
+        return True
+
+    def append(self, flowable) -> None:
+        pending = [flowable]
+        while pending:
+            f = pending.pop(0)
+            if self._try_draw(f):
+                continue
+            avail = self._y - self._bottom - self._space_before(f)
+            parts = f.splitOn(self.canvas, self._width, avail) if avail > 0 else []
+            if parts:
+                self._try_draw(parts[0], force=True)
+                pending[:0] = parts[1:]
+            elif self._at_top:
+                # Taller than a whole page and cannot split: draw it clipped
+                self._try_draw(f, force=True)
+            else:
+                self.canvas.showPage()
+                self._new_frame()
+                pending.insert(0, f)
+
+    def extend(self, flowables) -> None:
+        for flowable in flowables:
+            self.append(flowable)
+
+    def save(self) -> None:
+        self.canvas.save()
 
 
 class PDFExporter:
     """Generates a styled PDF report summarizing key system information."""
 
-    def __init__(self, logger=None):
+    # Paragraph styles are shared by all exporters; built on first use
+    _styles_ready = False
+    _styles_lock = threading.Lock()
+    styles = None
+    title_style = None
+    section_style = None
+    normal_style = None
+    small_style = None
+
+    def __init__(self, logger=None, fast_mode: bool = False):
         self.logger = logger
-        self.styles = getSampleStyleSheet()
-        self.title_style = ParagraphStyle(
-            name="TitleStyle",
-            parent=self.styles["Title"],
-            fontSize=20,
-            leading=24,
-            spaceAfter=12,
-        )
-        self.section_style = ParagraphStyle(
-            name="SectionStyle",
-            parent=self.styles["Heading2"],
-            fontSize=14,
-            leading=18,
-            spaceBefore=12,
-            spaceAfter=6,
-        )
-        self.normal_style = self.styles["BodyText"]
-        self.small_style = ParagraphStyle(
-            name="Small",
-            parent=self.styles["BodyText"],
-            fontSize=9,
-            leading=11,
-        )
-        # Default caps to keep report concise
-        self.max_software_rows = None  # show all installed programs
-        self.max_pci_rows = None  # show all PCI devices
+        # Draw straight onto a canvas instead of building a Platypus story
+        self.fast_mode = fast_mode
+        self._init_styles()
+        # Default caps to keep report concise; the software/PCI caps list everything
+        # on a normal machine but bound table layout time on pathological ones
+        self.max_software_rows = 500
+        self.max_pci_rows = 200
         self.max_usb_rows = 20
 
+    async def generate_report_async(self, data: Dict[str, Any], output_filename: str,
+                                    executor: Optional[Executor] = None) -> str:
+        """Run generate_report in an executor so the event loop stays responsive.
+
+        Uses the loop's default thread pool unless an executor is given.
+        `data` is read from the worker thread and must not be mutated until
+        the returned coroutine completes.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.generate_report, data, output_filename)
+
     def generate_report(self, data: Dict[str, Any], output_filename: str) -> str:
         """Create the PDF report.
 
@@ -54,56 +244,60 @@ class PDFExporter:
         - Storage: list all disks
         - Dell service tag
         """
-        doc = SimpleDocTemplate(
-            output_filename,
-            pagesize=A4,
-            leftMargin=18 * mm,
-            rightMargin=18 * mm,
-            topMargin=16 * mm,
-            bottomMargin=16 * mm,
-        )
-
-        story: List[Any] = []
+        if self.fast_mode:
+            story = _CanvasStory(output_filename, **_PAGE_LAYOUT)
+        else:
+            doc = SimpleDocTemplate(output_filename, **_PAGE_LAYOUT)
+            story: List[Any] = []
 
         # Title
         title = "System Information Report"
         story.append(Paragraph(title, self.title_style))
-        subtitle = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        subtitle = f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}"
         story.append(Paragraph(subtitle, self.small_style))
         story.append(Spacer(1, 8))
 
+        # Sections used by several parts of the report, looked up once
+        os_section = data.get("operating_system", {})
+        system_section = data.get("system", {})
+        software_section = data.get("software", {})
+
         # Overview section
         story.append(Paragraph("Overview", self.section_style))
         overview_rows = []
-        collection_ts = data.get("collection_timestamp", "Unknown")
+        collection_ts = data.get("collection_timestamp", _UNKNOWN)
         overview_rows.append(["Collection Time", collection_ts])
 
         # Add computer name
-        comp = data.get("operating_system", {}).get("computer_info", {})
-        env = data.get("operating_system", {}).get("environment_info", {})
-        computer_name = comp.get("computer_name") or env.get("hostname") or "Unknown"
+        comp = os_section.get("computer_info", {})
+        env = os_section.get("environment_info", {})
+        computer_name = comp.get("computer_name") or env.get("hostname") or _UNKNOWN
         overview_rows.append(["Computer Name", computer_name])
 
         # CPU, OS, GPU, RAM total
-        cpu = data.get("system", {}).get("cpu_info", {})
-        os_info = data.get("operating_system", {}).get("os_info", {})
-        gpu_list = data.get("system", {}).get("gpu_info", [])
+        cpu = system_section.get("cpu_info", {})
+        os_info = os_section.get("os_info", {})
+        gpu_list = system_section.get("gpu_info", [])
         memory = data.get("memory", {})
-        dell = data.get("system", {}).get("dell_info", {})
+        dell = system_section.get("dell_info", {})
 
-        overview_rows.append(["CPU", cpu.get("name", "Unknown")])
+        overview_rows.append(["CPU", cpu.get("name", _UNKNOWN)])
         if gpu_list:
-            overview_rows.append(["Primary GPU", gpu_list[0].get("name", "Unknown")])
-        windows_version = f"{os_info.get('name', 'Unknown')} {os_info.get('version', '')} (Build {os_info.get('build_number', 'Unknown')})"
+            overview_rows.append(["Primary GPU", gpu_list[0].get("name", _UNKNOWN)])
+        windows_version = f"{os_info.get('name', _UNKNOWN)} {os_info.get('version', '')} (Build {os_info.get('build_number', _UNKNOWN)})"
         overview_rows.append(["Windows Version", windows_version])
         if memory:
-            overview_rows.append(["Total RAM", f"{memory.get('total_ram_gb', 0)} GB"]) 
-            overview_rows.append(["Memory Modules", str(memory.get("total_modules", 0))])
+            overview_rows.extend([
+                ["Total RAM", f"{memory.get('total_ram_gb', 0)} GB"],
+                ["Memory Modules", str(memory.get("total_modules", 0))],
+            ])
 
         if dell:
-            overview_rows.append(["Manufacturer", dell.get("manufacturer", "Unknown")])
-            overview_rows.append(["Model", dell.get("model", "Unknown")])
-            overview_rows.append(["Dell Service Tag", dell.get("service_tag", "Unknown")])
+            overview_rows.extend([
+                ["Manufacturer", dell.get("manufacturer", _UNKNOWN)],
+                ["Model", dell.get("model", _UNKNOWN)],
+                ["Dell Service Tag", dell.get("service_tag", _UNKNOWN)],
+            ])
 
         overview_table = self._make_kv_table(overview_rows)
         story.append(overview_table)
@@ -111,83 +305,96 @@ class PDFExporter:
         # Network Interfaces section (Interface, IPs, Subnets only)
         story.append(Paragraph("Network Interfaces", self.section_style))
         net = data.get("network", {})
-        nics = net.get("network_interfaces", [])
-        net_table = [["Interface", "IP(s)", "Subnet(s)"]]
-        for n in nics:
-            ips = ", ".join(n.get("ip_addresses", []) or [])
-            subs = ", ".join(n.get("subnet_masks", []) or [])
-            net_table.append([
-                Paragraph(n.get("interface_name", "Unknown"), self.small_style),
-                Paragraph(ips or "", self.small_style),
-                Paragraph(subs or "", self.small_style),
-            ])
-        if len(net_table) == 1:
-            net_table.append(["None detected", "-", "-"])
-        story.append(self._make_table(net_table, col_widths=[60 * mm, 74 * mm, 40 * mm]))
-
-        # Network Scan section (with Serial if available)
-        scan = net.get("network_scan", {})
-        hosts = scan.get("hosts", [])
-        story.append(Paragraph("Network Scan (172.22.10.1-172.22.10.255)", self.section_style))
-        has_serial = any(h.get("serial") for h in hosts)
-        scan_table = [["IP Address", "Hostname"] + (["Serial"] if has_serial else [])]
-        for h in hosts:
-            row = [h.get("ip", ""), h.get("hostname", "")]
+        if not self._section_failed(story, net, "Network information"):
+            nics = net.get("network_interfaces", [])
+            name_w, ips_w, subs_w = net_widths = [60 * mm, 74 * mm, 40 * mm]
+            small_cell = self._small_cell
+            net_table = [NETWORK_HEADER, *[
+                [
+                    small_cell(n.get("interface_name", _UNKNOWN), name_w),
+                    small_cell(", ".join(n.get("ip_addresses", []) or []), ips_w),
+                    small_cell(", ".join(n.get("subnet_masks", []) or []), subs_w),
+                ]
+                for n in nics
+            ]]
+            if len(net_table) == 1:
+                net_table.append(["None detected", "-", "-"])
+            net_tables = self._make_long_tables(net_table, col_widths=net_widths)
+            if nics:
+                for table in net_tables:
+                    table.setStyle(_SMALL_ROWS_STYLE)
+            story.extend(net_tables)
+
+            # Network Scan section (with Serial if available)
+            scan = net.get("network_scan", {})
+            hosts = scan.get("hosts", [])
+            story.append(Paragraph("Network Scan (172.22.10.1-172.22.10.255)", self.section_style))
+            has_serial = any(h.get("serial") for h in hosts)
+            scan_table = [["IP Address", "Hostname"] + (["Serial"] if has_serial else [])]
             if has_serial:
-                row.append(h.get("serial", ""))
-            scan_table.append(row)
-        if len(scan_table) == 1:
-            scan_table.append(["No hosts found", "-"] + (["-"] if has_serial else []))
-        story.append(self._make_table(scan_table, col_widths=[50 * mm, None] + ([45 * mm] if has_serial else [])))
+                scan_table.extend([h.get("ip", ""), h.get("hostname", ""), h.get("serial", "")] for h in hosts)
+            else:
+                scan_table.extend([h.get("ip", ""), h.get("hostname", "")] for h in hosts)
+            if len(scan_table) == 1:
+                scan_table.append(["No hosts found", "-"] + (["-"] if has_serial else []))
+            story.extend(self._make_long_tables(scan_table, col_widths=[50 * mm, None] + ([45 * mm] if has_serial else [])))
 
         # RAM section: per-module locator, size, speed
         story.append(Paragraph("Memory Modules", self.section_style))
-        modules = memory.get("memory_modules", [])
-        ram_table_data = [["Slot", "Size (GB)", "Speed (MHz)", "Type"]]
-        for m in modules:
-            ram_table_data.append([
-                m.get("device_locator", "Unknown"),
-                m.get("capacity_gb", "0"),
-                m.get("speed_mhz", "Unknown"),
-                m.get("memory_type", "Unknown"),
-            ])
-        story.append(self._make_table(ram_table_data))
+        if not self._section_failed(story, memory, "Memory information"):
+            modules = memory.get("memory_modules", [])
+            ram_table_data = [RAM_HEADER, *[
+                [
+                    m.get("device_locator", _UNKNOWN),
+                    m.get("capacity_gb", "0"),
+                    m.get("speed_mhz", _UNKNOWN),
+                    m.get("memory_type", _UNKNOWN),
+                ]
+                for m in modules
+            ]]
+            story.append(self._make_table(ram_table_data))
 
         # Storage section: list all disks
         story.append(Paragraph("Storage Devices", self.section_style))
         storage = data.get("storage", {})
-        disks = storage.get("storage_devices", [])
-        storage_table_data = [["Model", "Type", "Size (GB)", "Serial", "Interface"]]
-        for s in disks:
-            storage_table_data.append([
-                s.get("model", "Unknown"),
-                s.get("drive_type", s.get("media_type", "Unknown")),
-                s.get("size_gb", 0),
-                s.get("serial_number", "Unknown"),
-                s.get("interface_type", "Unknown"),
-            ])
-        story.append(self._make_table(storage_table_data))
+        if not self._section_failed(story, storage, "Storage information"):
+            disks = storage.get("storage_devices", [])
+            storage_table_data = [STORAGE_HEADER, *[
+                [
+                    s.get("model", _UNKNOWN),
+                    s.get("drive_type", s.get("media_type", _UNKNOWN)),
+                    s.get("size_gb", 0),
+                    s.get("serial_number", _UNKNOWN),
+                    s.get("interface_type", _UNKNOWN),
+                ]
+                for s in disks
+            ]]
+            story.append(self._make_table(storage_table_data))
 
         # PCI devices: list all, filter out standard/system devices; include Serial
         pci = data.get("pci", {})
-        pci_devices = pci.get("pci_devices", [])
-        filtered_pci = self._filter_pci_devices(pci_devices)
         story.append(Paragraph("PCI Devices", self.section_style))
-        pci_table_data = [["Device Name", "Manufacturer", "Serial"]]
-        for p in filtered_pci[: self.max_pci_rows]:
-            pci_table_data.append([
-                p.get("device_name", "Unknown"),
-                p.get("manufacturer", "Unknown"),
-                p.get("serial_number", ""),
-            ])
-        if len(pci_table_data) == 1:
-            pci_table_data.append(["None detected", "-", "-"])
-        story.append(self._make_table(pci_table_data))
-        self._maybe_note_truncation(story, len(filtered_pci), len(pci_table_data) - 1, "PCI devices")
+        if not self._section_failed(story, pci, "PCI information"):
+            pci_devices = pci.get("pci_devices", [])
+            filtered_pci = self._filter_pci_devices(pci_devices)
+            pci_table_data = [PCI_HEADER, *[
+                [
+                    p.get("device_name", _UNKNOWN),
+                    p.get("manufacturer", _UNKNOWN),
+                    p.get("serial_number", ""),
+                ]
+                for p in filtered_pci[: self.max_pci_rows]
+            ]]
+            if len(pci_table_data) == 1:
+                pci_table_data.append(["None detected", "-", "-"])
+            story.extend(self._make_long_tables(pci_table_data))
+            pci_shown = len(pci_table_data) - 1
+            if len(filtered_pci) > pci_shown > 0:
+                self._note_truncation(story, len(filtered_pci), pci_shown, "PCI devices")
 
         # SPIN version and CodeMeter dongles
         story.append(Paragraph("Software Highlights", self.section_style))
-        spin = data.get("software", {}).get("spin_info", {})
+        spin = software_section.get("spin_info", {})
         spin_rows = [["SPIN Installed", str(spin.get("installed", False))],
                      ["SPIN Version", spin.get("version", "Not found")],
                      ["SPIN License", spin.get("license_number", "Not found")],
@@ -195,169 +402,179 @@ class PDFExporter:
         story.append(self._make_kv_table(spin_rows))
 
         story.append(Paragraph("CodeMeter Dongles", self.section_style))
-        dongles = data.get("software", {}).get("codemeter_dongles", {})
+        dongles = software_section.get("codemeter_dongles", {})
         dongle_list = dongles.get("dongles", [])
-        dongle_table = [["Name", "Serial", "Version", "Status", "Source"]]
-        for d in dongle_list:
-            dongle_table.append([
+        dongle_table = [DONGLE_HEADER, *[
+            [
                 d.get("device_name", "CodeMeter Dongle"),
-                d.get("serial_number", "Unknown"),
+                d.get("serial_number", _UNKNOWN),
                 d.get("version", ""),
                 d.get("status", ""),
                 d.get("source", "")
-            ])
+            ]
+            for d in dongle_list
+        ]]
         if len(dongle_table) == 1:
             dongle_table.append(["None detected", "-", "-", "-", "-"])
         story.append(self._make_table(dongle_table))
 
         # Short software list (filtered non-Microsoft)
         story.append(Paragraph("Installed Software (Filtered)", self.section_style))
-        sw_section = data.get("software", {})
-        programs = sw_section.get("installed_programs_filtered")
+        programs = software_section.get("installed_programs_filtered")
         if not programs:
             # Fallback: lightly filter the raw list if filtered list is empty/unavailable
-            raw_programs = sw_section.get("installed_programs", []) or []
+            raw_programs = software_section.get("installed_programs", []) or []
             programs = self._fallback_filter_programs(raw_programs)
-        sw_table = [["Name", "Version", "Publisher"]]
         programs_to_show = programs if self.max_software_rows is None else programs[: self.max_software_rows]
-        for prog in programs_to_show:
-            sw_table.append([
-                prog.get("name", prog.get("display_name", "Unknown")),
+        sw_table = [SOFTWARE_HEADER, *[
+            [
+                prog.get("name", prog.get("display_name", _UNKNOWN)),
                 prog.get("version", prog.get("displayversion", "")),
                 prog.get("publisher", "")
-            ])
-        story.append(self._make_table(sw_table))
-        if self.max_software_rows is not None:
-            self._maybe_note_truncation(story, len(programs), len(sw_table) - 1, "installed programs")
+            ]
+            for prog in programs_to_show
+        ]]
+        story.extend(self._make_long_tables(sw_table))
+        sw_shown = len(sw_table) - 1
+        if len(programs) > sw_shown > 0:
+            self._note_truncation(story, len(programs), sw_shown, "installed programs")
 
         # Build document
-        doc.build(story)
+        if self.fast_mode:
+            story.save()
+        else:
+            doc.build(story)
         if self.logger:
             self.logger.log_info(f"PDF report generated: {output_filename}")
         return output_filename
 
+    @classmethod
+    def _init_styles(cls) -> None:
+        if cls._styles_ready:
+            return
+        # Exporters are created on GUI/asyncio worker threads; build the styles once
+        with cls._styles_lock:
+            if not cls._styles_ready:
+                cls._build_styles()
+
+    @classmethod
+    def _build_styles(cls) -> None:
+        styles = getSampleStyleSheet()
+        cls.styles = styles
+        cls.title_style = ParagraphStyle(
+            name="TitleStyle",
+            parent=styles["Title"],
+            fontSize=20,
+            leading=24,
+            spaceAfter=12,
+        )
+        cls.section_style = ParagraphStyle(
+            name="SectionStyle",
+            parent=styles["Heading2"],
+            fontSize=14,
+            leading=18,
+            spaceBefore=12,
+            spaceAfter=6,
+        )
+        cls.normal_style = styles["BodyText"]
+        cls.small_style = ParagraphStyle(
+            name="Small",
+            parent=styles["BodyText"],
+            fontSize=9,
+            leading=11,
+        )
+        cls._styles_ready = True
+
     def _make_kv_table(self, rows: List[List[Any]]):
         table = Table(rows, hAlign="LEFT", colWidths=[45 * mm, None])
-        style = TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#f5f5f5")),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.HexColor("#333333")),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-            ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#cccccc")),
-            ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-        ])
-        table.setStyle(style)
+        table.setStyle(_KV_TABLE_STYLE)
         return table
 
     def _make_table(self, data: List[List[Any]], col_widths: Optional[List[Any]] = None):
         table = Table(data, hAlign="LEFT", colWidths=col_widths)
-        style = TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#e8eef8")),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("ALIGN", (0, 0), (-1, 0), "LEFT"),
-            ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#cccccc")),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f9fbff")]),
-        ])
-        table.setStyle(style)
+        table.setStyle(_DATA_TABLE_STYLE)
         return table
 
+    def _small_cell(self, text: str, width: float):
+        """Return text as-is when it fits on one line of the column, else a wrapping Paragraph."""
+        style = self.small_style
+        if stringWidth(text, style.fontName, style.fontSize) <= width - _CELL_PADDING:
+            return text
+        return Paragraph(text, style)
+
+    def _make_long_tables(self, data: List[List[Any]], col_widths: Optional[List[Any]] = None) -> List[Any]:
+        """Build a data table, split into LONG_TABLE_CHUNK-row LongTables when it is long."""
+        if len(data) - 1 <= LONG_TABLE_CHUNK:
+            return [self._make_table(data, col_widths)]
+        if col_widths is None or None in col_widths:
+            # Size columns once over every row so all chunks line up
+            sizing = Table(data, colWidths=col_widths)
+            sizing.wrap(_FRAME_WIDTH, 0)
+            col_widths = sizing._colWidths
+        header = data[0]
+        tables = []
+        for start in range(1, len(data), LONG_TABLE_CHUNK):
+            table = LongTable([header, *data[start:start + LONG_TABLE_CHUNK]],
+                              hAlign="LEFT", colWidths=col_widths, repeatRows=1)
+            table.setStyle(_DATA_TABLE_STYLE)
+            tables.append(table)
+        return tables
+
     def _fallback_filter_programs(self, programs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         try:
-            result: List[Dict[str, Any]] = []
             if not programs:
-                return result
-            exclude_tokens = [
-                "security update", "update", "hotfix", "servicing stack", "cumulative update", "feature update", "kb"
-            ]
+                return []
+            # Survivors are kept as (name, version, publisher) tuples; only the
+            # rows actually shown become dicts
+            rows = []
             for p in programs:
                 name = (p.get("name") or p.get("display_name") or "").strip()
                 if not name:
                     continue
-                lname = name.lower()
-                if any(tok in lname for tok in exclude_tokens):
+                if _PROGRAM_EXCLUDE_RE.search(name):
                     continue
+                publisher = p.get("publisher") or ""
                 # Prefer non-Microsoft, but keep some if list would be empty
-                publisher = (p.get("publisher") or "").lower()
-                if "microsoft" in publisher and len(result) > 0:
+                if rows and _MICROSOFT_RE.search(publisher):
                     continue
-                result.append({
-                    "name": name,
-                    "version": p.get("version") or p.get("displayversion") or "",
-                    "publisher": p.get("publisher") or ""
-                })
-            # Sort and cap
-            result.sort(key=lambda x: (x.get("name") or "", x.get("version") or ""))
-            return result[:40]
+                rows.append((name, p.get("version") or p.get("displayversion") or "", publisher))
+            # Same as sorting by name/version and keeping the first 40, without
+            # sorting the rest
+            return [
+                {"name": name, "version": version, "publisher": publisher}
+                for name, version, publisher in heapq.nsmallest(_FALLBACK_PROGRAM_LIMIT, rows, key=itemgetter(0, 1))
+            ]
         except Exception:
             return []
 
-    def _maybe_note_truncation(self, story: List[Any], total: int, shown: int, label: str) -> None:
-        try:
-            if total > shown and shown > 0:
-                story.append(Spacer(1, 2))
-                story.append(Paragraph(f"Showing first {shown} of {total} {label}.", self.small_style))
-                story.append(Spacer(1, 6))
-        except Exception:
-            pass
+    def _section_failed(self, story: List[Any], section: Dict[str, Any], label: str) -> bool:
+        """Add a one-line note in place of a section whose collector failed."""
+        if section.get("status") != "failed":
+            return False
+        reason = escape(str(section.get("error") or "collection failed"))
+        story.append(Paragraph(f"{label} unavailable: {reason}", self.small_style))
+        return True
+
+    def _note_truncation(self, story: List[Any], total: int, shown: int, label: str) -> None:
+        # Callers check total > shown first, so this only runs for capped tables
+        story.append(Spacer(1, 2))
+        story.append(Paragraph(f"Showing first {shown} of {total} {label}.", self.small_style))
+        story.append(Spacer(1, 6))
 
     def _filter_pci_devices(self, devices: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         try:
             if not devices:
                 return []
-            excluded_name_tokens = [
-                "motherboard resources",
-                "system timer",
-                "numeric data processor",
-                "programmable interrupt controller",
-                "direct memory access controller",
-                "high precision event timer",
-                "pci-to-pci bridge",
-                "pci express root port",
-                "root port",
-                "root complex",
-                "bus enumerator",
-                "composite bus enumerator",
-                "acpi",
-                "standard sata ahci controller",
-                "standard nvm express controller",
-                "standard pci-to-pci bridge",
-                "pci express downstream switch port",
-                "pci express upstream switch port",
-                "downstream switch port",
-                "upstream switch port",
-                "standard isa bridge",
-                "standard host cpu bridge",
-                # AMD generic/controller tokens from user feedback
-                "usb 3.10 extensible host controller",
-                "xhci host controller",
-                "generic usb xhci host controller",
-                "platform security processor",
-                "psp",
-                "smbus",
-                "amd-raid",
-                "raid bottom device",
-                "raid controller",
-                "amd raid",
-                "amd pci",
-            ]
             def is_standard(d: Dict[str, Any]) -> bool:
                 name = (d.get("device_name") or "").lower()
-                friendly = (d.get("friendly_name") or "").lower()
-                manufacturer = (d.get("manufacturer") or "").lower()
-                service = (d.get("service") or "").lower()
-                combined = " ".join([name, friendly, service])
-                if "microsoft" in manufacturer and ("standard" in name or any(tok in combined for tok in excluded_name_tokens)):
-                    return True
-                if any(tok in combined for tok in excluded_name_tokens):
-                    return True
-                if name.strip() in {"pci device"}:
+                if name.strip() == "pci device":
                     return True
-                # Extra guard: extremely short generic AMD entries
-                if manufacturer.startswith("advanced micro devices") and name in {"amd pci", "amd psp", "amd smbus"}:
+                # Tokens apply to every manufacturer (e.g. Intel root ports), so this
+                # scan cannot be skipped; generic AMD names like "amd psp" hit it too
+                combined = f'{name} {d.get("friendly_name") or ""} {d.get("service") or ""}'.lower()
+                if _PCI_EXCLUDE_RE.search(combined):
                     return True
-                return False
+                return "standard" in name and "microsoft" in (d.get("manufacturer") or "").lower()
             filtered = [d for d in devices if not is_standard(d)]
             try:
                 filtered.sort(key=lambda x: (x.get("manufacturer") or "", x.get("device_name") or ""))
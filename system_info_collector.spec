@@ -20,6 +20,7 @@ a = Analysis(
         'tkinter.scrolledtext',
         'threading',
         'json',
+        'orjson',
         'csv',
         'configparser',
         'xml.etree.ElementTree',
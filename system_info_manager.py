@@ -5,12 +5,20 @@ import csv
 import os
 import time
 from datetime import datetime
-from typing import Dict, Any
+from itertools import repeat
+from typing import Dict, Any, Tuple
 from pathlib import Path
+
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 from pdf_exporter import PDFExporter
 from log_config import setup_application_logging, SystemInfoLogger
 from collectors.pci_collector import PCICollector
-from collectors.usb_collector import USBCollector
+from collectors.base_collector import run_in_daemon_thread
+from collectors.usb_collector import USBCollector, to_records as usb_records, format_id as format_usb_id, with_hex_ids
 from collectors.memory_collector import MemoryCollector
 from collectors.storage_collector import StorageCollector
 from collectors.os_collector import OSCollector
@@ -19,6 +27,42 @@ from collectors.system_collector import SystemCollector
 from collectors.network_collector import NetworkCollector
 
 
+EXPORT_BUFFER_SIZE = 1 << 20  # Write buffer for export files
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback serializer for orjson: dict subclasses via items(), anything else via str()."""
+    if isinstance(obj, dict):
+        return dict(obj.items())
+    return str(obj)
+
+
+def _orjson_dumps(data: Any) -> bytes:
+    return orjson.dumps(
+        data,
+        default=_json_default,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_SUBCLASS,
+    )
+
+
+def _for_display(system_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Return ``system_info`` with values stored in compact form formatted for people.
+    
+    Only the USB vendor/product IDs need this; other sections are shared, not copied.
+    """
+    if isinstance(system_info.get("usb"), dict):
+        system_info = dict(system_info)
+        system_info["usb"] = with_hex_ids(system_info["usb"])
+    return system_info
+
+
+def dumps_json(data: Any) -> str:
+    """Pretty-print data as JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return _orjson_dumps(data).decode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str)
+
+
 class SystemInfoManager:
     """Manages system information collection and export."""
     
@@ -45,6 +89,7 @@ class SystemInfoManager:
     def collect_all_info(self) -> Dict[str, Any]:
         """Collect information from all collectors."""
         overall_start_time = time.time()
+        overall_start = time.perf_counter()
         self.logger.log_info("Starting comprehensive system information collection")
         
         self.system_info = {
@@ -56,10 +101,18 @@ class SystemInfoManager:
         successful_collections = 0
         failed_collections = 0
         
+        # Collectors spend their time in WMI, PowerShell and subprocess calls, which
+        # release the GIL; run them side by side so the total is the slowest one
+        # rather than the sum. safe_collect initializes COM for its own thread.
+        futures = {}
         for name, collector in self.collectors.items():
             self.logger.log_info(f"Starting {name} information collection")
+            futures[name] = run_in_daemon_thread(collector.safe_collect, name=f"collector-{name}")
+        
+        # Results are stored in collector order so exports keep a stable layout
+        for name, future in futures.items():
             try:
-                collection_result = collector.safe_collect()
+                collection_result = future.result()
                 self.system_info[name] = collection_result
                 
                 # Check if collection was successful
@@ -69,7 +122,7 @@ class SystemInfoManager:
                 else:
                     failed_collections += 1
                     self.logger.logger.warning(f"Collection failed for {name}: {collection_result.get('error', 'Unknown error')}")
-                    
+                        
             except Exception as e:
                 failed_collections += 1
                 error_msg = f"Unexpected error collecting {name} information: {str(e)}"
@@ -81,7 +134,7 @@ class SystemInfoManager:
                 }
         
         # Calculate overall collection time
-        overall_duration = time.time() - overall_start_time
+        overall_duration = time.perf_counter() - overall_start
         
         # Update final status
         self.system_info.update({
@@ -100,19 +153,26 @@ class SystemInfoManager:
     
     def export_to_json(self, filename: str = None) -> str:
         """Export system information to JSON file."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"system_info_{timestamp}.json"
         
         self.logger.log_info(f"Starting JSON export to {filename}")
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.system_info, f, indent=2, ensure_ascii=False, default=str)
+            data = _for_display(self.system_info)
+            if orjson is not None:
+                # orjson produces UTF-8 bytes directly, no intermediate str
+                with open(filename, 'wb') as f:
+                    f.write(_orjson_dumps(data))
+            else:
+                # json.dump issues many small writes; let the buffer batch them
+                with open(filename, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False, default=str)
             
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             file_size = os.path.getsize(filename) if os.path.exists(filename) else 0
             
             self.logger.log_export_operation("JSON", filename, True)
@@ -121,42 +181,39 @@ class SystemInfoManager:
             return filename
             
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             self.logger.log_export_operation("JSON", filename, False)
             self.logger.logger.error(f"Failed to export to JSON file {filename}: {str(e)}", exc_info=True)
             raise
     
     def export_to_csv(self, filename: str = None) -> str:
         """Export system information to CSV file (flattened format)."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"system_info_{timestamp}.csv"
         
         self.logger.log_info(f"Starting CSV export to {filename}")
         
         try:
-            flattened_data = self._flatten_data(self.system_info)
+            flattened_data, all_fieldnames = self._flatten_data(self.system_info)
             
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
                 if flattened_data:
-                    # Collect all possible fieldnames from all rows
-                    all_fieldnames = set()
-                    for row in flattened_data:
-                        all_fieldnames.update(row.keys())
-                    
                     # Sort fieldnames for consistent output, with 'category' first
                     fieldnames = sorted(all_fieldnames)
                     if 'category' in fieldnames:
                         fieldnames.remove('category')
                         fieldnames.insert(0, 'category')
                     
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(flattened_data)
+                    # fieldnames is the union of every row's keys, so no extra-key check is
+                    # needed; map(row.get, ...) fills missing columns with '' in C
+                    writer = csv.writer(f)
+                    writer.writerow(fieldnames)
+                    writer.writerows(map(row.get, fieldnames, repeat('')) for row in flattened_data)
             
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             file_size = os.path.getsize(filename) if os.path.exists(filename) else 0
             row_count = len(flattened_data) if flattened_data else 0
             
@@ -166,17 +223,17 @@ class SystemInfoManager:
             return filename
             
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             self.logger.log_export_operation("CSV", filename, False)
             self.logger.logger.error(f"Failed to export to CSV file {filename}: {str(e)}", exc_info=True)
             raise
 
     def export_to_pdf(self, filename: str = None) -> str:
         """Export system information to a styled PDF report."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"system_info_{timestamp}.pdf"
         
         self.logger.log_info(f"Starting PDF export to {filename}")
@@ -185,7 +242,7 @@ class SystemInfoManager:
             exporter = PDFExporter(self.logger)
             output_path = exporter.generate_report(self.system_info, filename)
             
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             file_size = os.path.getsize(output_path) if os.path.exists(output_path) else 0
             
             self.logger.log_export_operation("PDF", output_path, True)
@@ -193,30 +250,49 @@ class SystemInfoManager:
             
             return output_path
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             self.logger.log_export_operation("PDF", filename, False)
             self.logger.logger.error(f"Failed to export to PDF file {filename}: {str(e)}", exc_info=True)
             raise
     
-    def _flatten_data(self, data: Dict[str, Any], parent_key: str = '') -> list:
-        """Flatten nested dictionary data for CSV export."""
+    def _flatten_data(self, data: Dict[str, Any], parent_key: str = '') -> Tuple[list, set]:
+        """Flatten nested dictionary data for CSV export.
+        
+        Returns the rows together with the union of their keys, gathered as
+        rows are added so the export does not need another pass over them.
+        """
         flattened_rows = []
+        fieldnames = set()
+        
+        def add_row(row: dict) -> None:
+            fieldnames.update(row)
+            flattened_rows.append(row)
         
         def flatten_dict(d: dict, parent: str = '') -> dict:
-            items = []
-            for k, v in d.items():
-                new_key = f"{parent}_{k}" if parent else k
-                if isinstance(v, dict):
-                    items.extend(flatten_dict(v, new_key).items())
-                elif isinstance(v, list):
-                    for i, item in enumerate(v):
-                        if isinstance(item, dict):
-                            items.extend(flatten_dict(item, f"{new_key}_{i}").items())
-                        else:
-                            items.append((f"{new_key}_{i}", str(item)))
+            flat = {}
+            # Explicit stack of (key, value, is_list_item); children are pushed in
+            # reverse so keys come out in the same order as a recursive walk
+            stack = [(parent, d, False)]
+            while stack:
+                key, value, is_list_item = stack.pop()
+                value_type = type(value)
+                # Exact-type checks first: most leaves are str and most containers are
+                # plain dicts/lists; isinstance still catches subclasses
+                if value_type is str:
+                    flat[key] = value
+                elif value_type is dict or isinstance(value, dict):
+                    stack.extend(
+                        (f"{key}_{k}" if key else k, v, False) for k, v in reversed(value.items())
+                    )
+                elif (value_type is list or isinstance(value, list)) and not is_list_item:
+                    stack.extend(
+                        (f"{key}_{i}", item, True)
+                        for i, item in zip(range(len(value) - 1, -1, -1), reversed(value))
+                    )
                 else:
-                    items.append((new_key, str(v)))
-            return dict(items)
+                    # Lists nested directly in lists are stringified, not expanded
+                    flat[key] = str(value)
+            return flat
         
         # Overview row with computer name
         try:
@@ -227,7 +303,7 @@ class SystemInfoManager:
                 'computer_name': comp.get('computer_name') or env.get('hostname') or 'Unknown',
                 'collection_time': data.get('collection_timestamp', ''),
             }
-            flattened_rows.append(overview_row)
+            add_row(overview_row)
         except Exception:
             pass
         
@@ -243,43 +319,46 @@ class SystemInfoManager:
                     for device in category_data['pci_devices']:
                         row = {'category': 'PCI Device'}
                         row.update(flatten_dict(device))
-                        flattened_rows.append(row)
+                        add_row(row)
                 
                 elif category == 'usb' and 'usb_devices' in category_data:
-                    for device in category_data['usb_devices']:
+                    for device in usb_records(category_data['usb_devices']):
                         row = {'category': 'USB Device'}
                         row.update(flatten_dict(device))
-                        flattened_rows.append(row)
+                        # IDs are stored as integers; export them in hex like Device Manager
+                        row['vendor_id'] = format_usb_id(device['vendor_id'])
+                        row['product_id'] = format_usb_id(device['product_id'])
+                        add_row(row)
                 
                 elif category == 'memory' and 'memory_modules' in category_data:
                     for module in category_data['memory_modules']:
                         row = {'category': 'Memory Module'}
                         row.update(flatten_dict(module))
-                        flattened_rows.append(row)
+                        add_row(row)
                 
                 elif category == 'storage' and 'storage_devices' in category_data:
                     for device in category_data['storage_devices']:
                         row = {'category': 'Storage Device'}
                         row.update(flatten_dict(device))
-                        flattened_rows.append(row)
+                        add_row(row)
                 
                 elif category == 'network' and 'network_interfaces' in category_data:
                     for iface in category_data['network_interfaces']:
                         row = {'category': 'Network Interface'}
                         row.update(flatten_dict(iface))
-                        flattened_rows.append(row)
+                        add_row(row)
                     # Also include scan hosts if present
                     if 'network_scan' in category_data and 'hosts' in category_data['network_scan']:
                         for host in category_data['network_scan']['hosts']:
                             row = {'category': 'Network Scan Host'}
                             row.update(flatten_dict(host))
-                            flattened_rows.append(row)
+                            add_row(row)
                 
                 elif category == 'system' and 'gpu_info' in category_data:
                     for gpu in category_data['gpu_info']:
                         row = {'category': 'GPU'}
                         row.update(flatten_dict(gpu))
-                        flattened_rows.append(row)
+                        add_row(row)
                 
                 else:
                     # For other categories, create a single row
@@ -292,9 +371,9 @@ class SystemInfoManager:
                         row.update(flatten_dict(temp))
                     else:
                         row.update(flatten_dict(category_data))
-                    flattened_rows.append(row)
+                    add_row(row)
         
-        return flattened_rows
+        return flattened_rows, fieldnames
     
     def get_summary(self) -> Dict[str, Any]:
         """Get a summary of collected information."""
@@ -313,7 +392,7 @@ class SystemInfoManager:
         
         # USB summary
         if "usb" in self.system_info and "usb_devices" in self.system_info["usb"]:
-            summary["summary"]["usb_devices_count"] = len(self.system_info["usb"]["usb_devices"])
+            summary["summary"]["usb_devices_count"] = self.system_info["usb"].get("total_devices", 0)
         
         # Memory summary
         if "memory" in self.system_info and "total_ram_gb" in self.system_info["memory"]:
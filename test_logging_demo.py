@@ -1,14 +1,28 @@
 """Demonstration script for the enhanced logging system."""
 
+import logging
+import os
 import time
 from log_config import setup_application_logging, SystemInfoLogger, log_config
 
+# Set LOGDEMO_SIMULATE=1 to pause where the demo pretends to do work;
+# by default it runs straight through (e.g. as a CI smoke test)
+SIMULATE_WORK = os.environ.get("LOGDEMO_SIMULATE") == "1"
+
+SEPARATOR = "=" * 60
+
+
+def _simulate_work(seconds: float):
+    """Sleep for ``seconds`` when simulated work is enabled."""
+    if SIMULATE_WORK:
+        time.sleep(seconds)
+
 
 def demonstrate_logging():
     """Demonstrate the logging functionality."""
     
     print("System Information Collector - Logging Demonstration")
-    print("=" * 60)
+    print(SEPARATOR)
     
     # Setup logging
     print("1. Setting up comprehensive logging...")
@@ -17,36 +31,42 @@ def demonstrate_logging():
     # Create a logger
     logger = SystemInfoLogger("Demo")
     
-    print(f"2. Log files will be created in: {log_config.log_dir.absolute()}")
+    print(f"2. Log files will be created in: {log_config.log_dir_abs}")
     
     # Demonstrate different log levels
     print("\n3. Demonstrating different log levels...")
     
-    logger.logger.debug("This is a DEBUG message - detailed technical information")
-    logger.logger.info("This is an INFO message - general information")
-    logger.logger.warning("This is a WARNING message - something might be wrong")
-    logger.logger.error("This is an ERROR message - something went wrong")
+    log = logger.logger
+    for level, message in (
+        (logging.DEBUG, "This is a DEBUG message - detailed technical information"),
+        (logging.INFO, "This is an INFO message - general information"),
+        (logging.WARNING, "This is a WARNING message - something might be wrong"),
+        (logging.ERROR, "This is an ERROR message - something went wrong"),
+    ):
+        log.log(level, message)
     
     # Demonstrate collection logging
     print("\n4. Demonstrating collection-specific logging...")
     
     logger.log_collection_start("Demo Collector")
-    time.sleep(0.1)  # Simulate collection work
+    _simulate_work(0.1)  # Simulate collection work
     logger.log_collection_success("Demo Collector", 42)
     
     # Demonstrate performance logging
     print("\n5. Demonstrating performance logging...")
     
-    start_time = time.time()
-    time.sleep(0.2)  # Simulate some work
-    duration = time.time() - start_time
+    start_time = time.perf_counter()
+    _simulate_work(0.2)  # Simulate some work
+    duration = time.perf_counter() - start_time
     logger.log_performance("Demo operation", duration)
     
     # Demonstrate export logging
     print("\n6. Demonstrating export logging...")
     
-    logger.log_export_operation("JSON", "demo_file.json", True)
-    logger.log_export_operation("CSV", "demo_file.csv", True)
+    logger.log_export_operations([
+        ("JSON", "demo_file.json", True),
+        ("CSV", "demo_file.csv", True),
+    ])
     
     # Demonstrate error logging with exception
     print("\n7. Demonstrating error logging with exception...")
@@ -59,25 +79,24 @@ def demonstrate_logging():
     
     # Show log file information
     print("\n8. Log file information:")
-    log_files = log_config.get_log_files()
-    for log_file in log_files:
-        try:
-            size = log_file.stat().st_size
-            print(f"   - {log_file.name}: {size} bytes")
-        except:
-            print(f"   - {log_file.name}: Error reading file")
+    # File handlers are buffered behind a queue; write everything out before sizing
+    log_config.flush()
+    lines = [f"   - {name}: {size} bytes" for name, size in log_config.iter_log_files()]
+    if lines:
+        print("\n".join(lines))
     
     # Demonstrate log content reading
     print("\n9. Sample log content (last 10 lines):")
-    try:
-        content = log_config.get_latest_log_content(max_lines=10)
-        print("   " + "\n   ".join(content.split('\n')[-10:]))
-    except Exception as e:
-        print(f"   Error reading log content: {e}")
-    
-    print("\n" + "=" * 60)
+    # Served from the in-memory ring of recent records; no need to reread the file
+    tail = log_config.tail(10)
+    if tail:
+        print("   " + "\n   ".join(tail))
+    else:
+        print("   No log records available.")
+    
+    print("\n" + SEPARATOR)
     print("Logging demonstration completed!")
-    print(f"Check the logs directory: {log_config.log_dir.absolute()}")
+    print(f"Check the logs directory: {log_config.log_dir_abs}")
     print("Files created:")
     print("  - system_info_app.log (main application log)")
     print("  - system_info_errors.log (error-only log)")